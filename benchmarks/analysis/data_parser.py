@@ -4,6 +4,7 @@ Benchmark data parser for loading and processing benchmark results
 
 import json
 import re
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Union
@@ -18,6 +19,10 @@ class BenchmarkDataParser:
         self.results_dir = Path(results_dir)
         if not self.results_dir.exists():
             raise FileNotFoundError(f"Results directory not found: {self.results_dir}")
+        # Parsed results by file, reused until the file's mtime or size changes
+        self._result_cache: dict[
+            Path, tuple[tuple[int, int], BenchmarkResult | None]
+        ] = {}
 
     def load_all_results(self) -> list[BenchmarkResult]:
         """Load all benchmark results from the results directory"""
@@ -27,7 +32,7 @@ class BenchmarkDataParser:
         json_files = list(self.results_dir.glob("grainchain_benchmark_*.json"))
         for json_file in json_files:
             try:
-                result = self.load_json_result(json_file)
+                result = self._load_cached(json_file, self.load_json_result)
                 if result:
                     results.append(result)
             except Exception as e:
@@ -38,7 +43,7 @@ class BenchmarkDataParser:
             md_files = list(self.results_dir.glob("grainchain_benchmark_*.md"))
             for md_file in md_files:
                 try:
-                    result = self.load_markdown_result(md_file)
+                    result = self._load_cached(md_file, self.load_markdown_result)
                     if result:
                         results.append(result)
                 except Exception as e:
@@ -48,11 +53,26 @@ class BenchmarkDataParser:
         results.sort(key=lambda x: x.timestamp)
         return results
 
+    def _load_cached(
+        self,
+        file_path: Path,
+        loader: Callable[[Path], BenchmarkResult | None],
+    ) -> BenchmarkResult | None:
+        """Load a result file, skipping the read and parse if it is unchanged"""
+        stat = file_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._result_cache.get(file_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        result = loader(file_path)
+        self._result_cache[file_path] = (key, result)
+        return result
+
     def load_json_result(self, file_path: Path) -> BenchmarkResult | None:
         """Load a benchmark result from a JSON file"""
         try:
-            with open(file_path) as f:
-                data = json.load(f)
+            data = json.loads(file_path.read_bytes())
 
             return self._parse_json_data(data, file_path)
         except Exception as e:
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any, Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioMetrics:
     """Metrics for a single test scenario"""
 
@@ -24,7 +24,7 @@ class ScenarioMetrics:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderMetrics:
     """Comprehensive metrics for a provider"""
 
@@ -39,7 +39,7 @@ class ProviderMetrics:
     status: str = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Complete benchmark result for analysis"""
 
@@ -52,7 +52,7 @@ class BenchmarkResult:
     raw_data: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Result of comparing benchmark data"""
 
@@ -66,7 +66,7 @@ class ComparisonResult:
     detailed_analysis: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendAnalysis:
     """Time-series trend analysis result"""
 
@@ -79,7 +79,7 @@ class TrendAnalysis:
     statistical_summary: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderRecommendation:
     """Provider recommendation based on analysis"""
 
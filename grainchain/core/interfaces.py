@@ -2,6 +2,7 @@
 
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -143,6 +144,44 @@ class SandboxSession(ABC):
         """Execute a command in the sandbox."""
         pass
 
+    async def execute_stream(
+        self,
+        command: str,
+        on_output: Callable[[str, str], None],
+        timeout: int | None = None,
+        working_dir: str | None = None,
+        environment: dict[str, str] | None = None,
+    ) -> ExecutionResult:
+        """Execute a command, passing its output to ``on_output``.
+
+        ``on_output`` is called with the stream name (``"stdout"`` or
+        ``"stderr"``) and a chunk of text. Providers that cannot stream
+        deliver each stream in one chunk once the command has finished.
+
+        An exception raised by ``on_output`` is not propagated: streaming
+        stops and a failed result is returned with the error as its
+        ``stderr``. Providers overriding this method must do the same.
+
+        Returns:
+            ExecutionResult with the full command output
+        """
+        result = await self.execute(command, timeout, working_dir, environment)
+        try:
+            if result.stdout:
+                on_output("stdout", result.stdout)
+            if result.stderr:
+                on_output("stderr", result.stderr)
+        except Exception as e:
+            return ExecutionResult(
+                stdout="",
+                stderr=str(e),
+                return_code=-1,
+                execution_time=result.execution_time,
+                success=False,
+                command=command,
+            )
+        return result
+
     @abstractmethod
     async def upload_file(
         self, path: str, content: str | bytes, mode: str = "w"
@@ -1,5 +1,6 @@
 """Provider information and discovery utilities for Grainchain."""
 
+import importlib.util
 import os
 from dataclasses import dataclass, field
 
@@ -69,12 +70,9 @@ class ProviderDiscovery:
         if not dependencies:
             return True
 
-        for dep in dependencies:
-            try:
-                __import__(dep)
-            except ImportError:
-                return False
-        return True
+        # Only locate the packages; importing provider SDKs just to report
+        # their presence is slow and pulls in their whole dependency tree.
+        return all(importlib.util.find_spec(dep) is not None for dep in dependencies)
 
     def check_provider_config(self, provider_name: str) -> tuple[bool, list[str]]:
         """Check if a provider is properly configured."""
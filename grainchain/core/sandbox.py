@@ -1,6 +1,7 @@
 """Main Sandbox class - the primary interface for Grainchain."""
 
 import logging
+from collections.abc import Callable
 
 from grainchain.core.config import get_config_manager
 from grainchain.core.exceptions import ConfigurationError, SandboxError
@@ -172,6 +173,49 @@ class Sandbox:
             logger.error(f"Command execution failed: {e}")
             raise SandboxError(f"Command execution failed: {e}") from e
 
+    async def execute_stream(
+        self,
+        command: str,
+        on_output: Callable[[str, str], None],
+        timeout: int | None = None,
+        working_dir: str | None = None,
+        environment: dict[str, str] | None = None,
+    ) -> ExecutionResult:
+        """
+        Execute a command in the sandbox, streaming its output.
+
+        Args:
+            command: Command to execute
+            on_output: Called with the stream name ("stdout" or "stderr") and
+                each chunk of output as it arrives
+            timeout: Execution timeout in seconds (overrides config default)
+            working_dir: Working directory for command execution
+            environment: Additional environment variables
+
+        Returns:
+            ExecutionResult with the full command output and metadata
+        """
+        session = self._ensure_session()
+
+        # Use provided timeout or fall back to config default
+        effective_timeout = timeout or self._config.timeout
+
+        try:
+            result = await session.execute_stream(
+                command=command,
+                on_output=on_output,
+                timeout=effective_timeout,
+                working_dir=working_dir,
+                environment=environment,
+            )
+            logger.debug(
+                f"Executed command '{command}' with return code {result.return_code}"
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Command execution failed: {e}")
+            raise SandboxError(f"Command execution failed: {e}") from e
+
     async def upload_file(
         self, path: str, content: str | bytes, mode: str = "w"
     ) -> None:
@@ -2,12 +2,14 @@
 
 import asyncio
 import logging
+import time
 from abc import abstractmethod
 from typing import Any
 
 from grainchain.core.config import ProviderConfig
 from grainchain.core.exceptions import ConfigurationError, ProviderError
 from grainchain.core.interfaces import (
+    ExecutionResult,
     SandboxConfig,
     SandboxProvider,
     SandboxSession,
@@ -203,6 +205,19 @@ class BaseSandboxSession(SandboxSession):
                 f"Sandbox {self.sandbox_id} is closed", self._provider.name
             )
 
+    def _error_result(
+        self, command: str, stderr: str, start_time: float, return_code: int = -1
+    ) -> ExecutionResult:
+        """Build the result for a command that failed without producing output."""
+        return ExecutionResult(
+            stdout="",
+            stderr=stderr,
+            return_code=return_code,
+            execution_time=time.monotonic() - start_time,
+            success=False,
+            command=command,
+        )
+
     # Default implementations that can be overridden
 
     async def create_snapshot(self) -> str:
@@ -1,5 +1,6 @@
 """Daytona provider implementation for Grainchain."""
 
+import asyncio
 import time
 from typing import Any
 
@@ -51,8 +52,8 @@ class DaytonaProvider(BaseSandboxProvider):
             # Initialize Daytona client
             daytona = Daytona(daytona_config)
 
-            # Create sandbox
-            sandbox = daytona.create()
+            # Create sandbox; the SDK call blocks, so keep it off the event loop
+            sandbox = await asyncio.to_thread(daytona.create)
 
             session = DaytonaSandboxSession(
                 sandbox_id=sandbox.id,
@@ -115,7 +116,7 @@ class DaytonaSandboxSession(BaseSandboxSession):
         environment: dict[str, str] | None = None,
     ) -> ExecutionResult:
         """Execute a command in the Daytona sandbox."""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Use the configured working directory if no specific one is provided
@@ -162,9 +163,11 @@ except Exception as e:
 """
 
             # Execute the Python code that runs our shell command
-            response = self.daytona_sandbox.process.code_run(python_code)
+            response = await asyncio.to_thread(
+                self.daytona_sandbox.process.code_run, python_code
+            )
 
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             # Parse the response - look for our custom output format
             result_text = getattr(response, "result", "") or ""
@@ -210,16 +213,7 @@ except Exception as e:
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
-
-            return ExecutionResult(
-                stdout="",
-                stderr=str(e),
-                return_code=-1,
-                execution_time=execution_time,
-                success=False,
-                command=command,
-            )
+            return self._error_result(command, str(e), start_time)
 
     async def upload_file(
         self, path: str, content: str | bytes, mode: str = "text"
@@ -249,7 +243,9 @@ except Exception as e:
                     temp_file_path = temp_file.name
 
                 # Upload the temp file
-                self.daytona_sandbox.fs.upload_file(temp_file_path, upload_path)
+                await asyncio.to_thread(
+                    self.daytona_sandbox.fs.upload_file, temp_file_path, upload_path
+                )
 
                 # Clean up temp file
                 import os
@@ -266,7 +262,9 @@ except Exception as e:
                     temp_file_path = temp_file.name
 
                 # Upload the temp file
-                self.daytona_sandbox.fs.upload_file(temp_file_path, upload_path)
+                await asyncio.to_thread(
+                    self.daytona_sandbox.fs.upload_file, temp_file_path, upload_path
+                )
 
                 # Clean up temp file
                 import os
@@ -296,7 +294,7 @@ except Exception as e:
         """List files in the Daytona sandbox."""
         try:
             # Use Daytona's file system list_files method
-            files = self.daytona_sandbox.fs.list_files(path)
+            files = await asyncio.to_thread(self.daytona_sandbox.fs.list_files, path)
             file_infos = []
 
             for file in files:
@@ -366,7 +364,7 @@ except Exception as e:
         """Clean up Daytona sandbox resources."""
         try:
             # Stop the sandbox
-            self.daytona_sandbox.stop()
+            await asyncio.to_thread(self.daytona_sandbox.stop)
         except Exception as e:
             # Log but don't raise - cleanup should be best effort
             import logging
@@ -378,7 +376,9 @@ except Exception as e:
         if self.daytona_sandbox and not self._closed:
             try:
                 # Clean up using the recommended pattern
-                self.daytona_client.remove(self.daytona_sandbox)
+                await asyncio.to_thread(
+                    self.daytona_client.remove, self.daytona_sandbox
+                )
             except Exception as e:
                 # Log error but don't raise - cleanup should be best effort
                 print(f"Error closing Daytona sandbox: {e}")
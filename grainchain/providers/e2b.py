@@ -96,7 +96,7 @@ class E2BSandboxSession(BaseSandboxSession):
         """Execute a command in the E2B sandbox."""
         import time
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Use E2B commands API
@@ -107,7 +107,7 @@ class E2BSandboxSession(BaseSandboxSession):
                 envs=environment or {},
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             return ExecutionResult(
                 stdout=result.stdout,
@@ -119,27 +119,15 @@ class E2BSandboxSession(BaseSandboxSession):
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
-
             # Handle E2B-specific errors
             if "timeout" in str(e).lower():
-                return ExecutionResult(
-                    stdout="",
-                    stderr=f"Command timed out after {timeout or self._config.timeout} seconds",
-                    return_code=-1,
-                    execution_time=execution_time,
-                    success=False,
-                    command=command,
+                return self._error_result(
+                    command,
+                    f"Command timed out after {timeout or self._config.timeout} seconds",
+                    start_time,
                 )
             else:
-                return ExecutionResult(
-                    stdout="",
-                    stderr=str(e),
-                    return_code=-1,
-                    execution_time=execution_time,
-                    success=False,
-                    command=command,
-                )
+                return self._error_result(command, str(e), start_time)
 
     async def upload_file(
         self, path: str, content: str | bytes, mode: str = "text"
@@ -1,11 +1,16 @@
 """Local provider implementation for Grainchain (for development and testing)."""
 
 import asyncio
+import codecs
+import errno
 import os
+import re
 import shutil
+import signal
 import tempfile
 import time
 import uuid
+from collections.abc import Callable
 from pathlib import Path
 
 from grainchain.core.config import ProviderConfig
@@ -18,6 +23,115 @@ from grainchain.core.interfaces import (
 )
 from grainchain.providers.base import BaseSandboxProvider, BaseSandboxSession
 
+# Characters that need /bin/sh to interpret them (pipes, redirection,
+# expansion, quoting, globbing, comments)
+_has_shell_metachar = re.compile(r"""[|&;<>()$`\\"'*?\[\]{}#~=%!\n]""").search
+
+# Shell reserved words and builtins. Commands starting with one of these
+# go through /bin/sh, either because no executable of that name exists or
+# because the builtin behaves differently from the binary (e.g. echo -e)
+_SHELL_BUILTINS = frozenset(
+    {
+        # Reserved words
+        "!",
+        "[[",
+        "]]",
+        "case",
+        "do",
+        "done",
+        "elif",
+        "else",
+        "esac",
+        "fi",
+        "for",
+        "function",
+        "if",
+        "in",
+        "select",
+        "then",
+        "time",
+        "until",
+        "while",
+        "{",
+        "}",
+        # POSIX special builtins
+        ".",
+        ":",
+        "break",
+        "continue",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "readonly",
+        "return",
+        "set",
+        "shift",
+        "times",
+        "trap",
+        "unset",
+        # POSIX regular builtins
+        "[",
+        "alias",
+        "bg",
+        "cd",
+        "command",
+        "echo",
+        "false",
+        "fc",
+        "fg",
+        "getopts",
+        "hash",
+        "jobs",
+        "kill",
+        "printf",
+        "pwd",
+        "read",
+        "test",
+        "true",
+        "type",
+        "ulimit",
+        "umask",
+        "unalias",
+        "wait",
+        # Common bash/dash extensions
+        "builtin",
+        "declare",
+        "dirs",
+        "disown",
+        "enable",
+        "let",
+        "local",
+        "logout",
+        "popd",
+        "pushd",
+        "shopt",
+        "source",
+        "typeset",
+    }
+)
+
+# Bytes read per call when streaming command output
+_STREAM_CHUNK_SIZE = 4096
+
+# /bin/sh only splits words on blanks, not on other whitespace like \r
+_split_on_blanks = re.compile(r"[ \t]+").split
+
+
+def _split_simple_command(command: str) -> list[str] | None:
+    """Split a command into argv if it can run without a shell.
+
+    Returns None when the command uses shell syntax or starts with a shell
+    builtin or reserved word, in which case it has to go through
+    ``/bin/sh -c``.
+    """
+    if _has_shell_metachar(command):
+        return None
+    argv = [arg for arg in _split_on_blanks(command) if arg]
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    return argv
+
 
 class LocalProvider(BaseSandboxProvider):
     """Local sandbox provider implementation using temporary directories."""
@@ -82,6 +196,84 @@ class LocalSandboxSession(BaseSandboxSession):
         self._snapshots: dict[str, str] = {}
         self._set_status(SandboxStatus.RUNNING)
 
+    async def _spawn(
+        self,
+        command: str,
+        working_dir: str | None,
+        environment: dict[str, str] | None,
+    ) -> asyncio.subprocess.Process:
+        """Start a command with piped stdout/stderr."""
+        # Determine working directory
+        exec_dir = working_dir or self.working_dir
+
+        # Only build a merged environment when something overrides the host
+        # one; env=None lets the child inherit os.environ without a copy
+        overrides = {**self.config.environment_vars, **(environment or {})}
+        env = {**os.environ, **overrides} if overrides else None
+
+        # Plain commands that resolve to an executable are exec'd directly,
+        # saving the /bin/sh fork; anything else keeps the shell's semantics
+        # (builtins, "not found" handling, scripts without a shebang)
+        argv = _split_simple_command(command)
+        if argv is not None and self._resolves(argv[0], exec_dir, env):
+            try:
+                return await asyncio.create_subprocess_exec(
+                    *argv,
+                    cwd=exec_dir,
+                    env=env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True,
+                )
+            except OSError as e:
+                if e.errno != errno.ENOEXEC:
+                    raise
+
+        return await asyncio.create_subprocess_shell(
+            command,
+            cwd=exec_dir,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        """Kill a command and everything it started, then reap it."""
+        # Commands run in their own session, so their pid is the group id
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+    @staticmethod
+    def _resolves(program: str, exec_dir: str, env: dict[str, str] | None) -> bool:
+        """Check whether ``program`` names an executable the child can exec."""
+        if "/" in program:
+            # Relative paths are resolved from the child's working directory
+            return shutil.which(os.path.join(exec_dir, program)) is not None
+        path = (os.environ if env is None else env).get("PATH", os.defpath)
+        return shutil.which(program, path=path) is not None
+
+    def _failed_result(
+        self, command: str, error: Exception, start_time: float
+    ) -> ExecutionResult:
+        """Build the result for a command that could not run to completion."""
+        if isinstance(error, FileNotFoundError | PermissionError):
+            argv = _split_simple_command(command)
+            if argv and error.filename == argv[0]:
+                # Match the shell's exit codes for missing/non-executable
+                return self._error_result(
+                    command,
+                    f"{argv[0]}: {error.strerror}\n",
+                    start_time,
+                    return_code=127 if isinstance(error, FileNotFoundError) else 126,
+                )
+
+        return self._error_result(command, str(error), start_time)
+
     async def execute(
         self,
         command: str,
@@ -92,26 +284,10 @@ class LocalSandboxSession(BaseSandboxSession):
         """Execute a command in the local sandbox."""
         self._ensure_not_closed()
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            # Determine working directory
-            exec_dir = working_dir or self.working_dir
-
-            # Prepare environment
-            env = os.environ.copy()
-            env.update(self.config.environment_vars)
-            if environment:
-                env.update(environment)
-
-            # Create subprocess
-            process = await asyncio.create_subprocess_shell(
-                command,
-                cwd=exec_dir,
-                env=env,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            process = await self._spawn(command, working_dir, environment)
 
             # Wait for completion with timeout
             try:
@@ -119,14 +295,13 @@ class LocalSandboxSession(BaseSandboxSession):
                     process.communicate(), timeout=timeout or self.config.timeout
                 )
             except TimeoutError:
-                process.kill()
-                await process.wait()
+                await self._kill(process)
                 raise ProviderError(
                     f"Command timed out after {timeout or self.config.timeout} seconds",
                     self._provider.name,
                 ) from None
 
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             return ExecutionResult(
                 stdout=stdout.decode("utf-8", errors="replace"),
@@ -138,15 +313,92 @@ class LocalSandboxSession(BaseSandboxSession):
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
-            return ExecutionResult(
-                stdout="",
-                stderr=str(e),
-                return_code=-1,
-                execution_time=execution_time,
-                success=False,
-                command=command,
+            return self._failed_result(command, e, start_time)
+
+    async def execute_stream(
+        self,
+        command: str,
+        on_output: Callable[[str, str], None],
+        timeout: int | None = None,
+        working_dir: str | None = None,
+        environment: dict[str, str] | None = None,
+    ) -> ExecutionResult:
+        """Execute a command, handing output to ``on_output`` as it arrives.
+
+        ``on_output`` is called with the stream name (``"stdout"`` or
+        ``"stderr"``) and each decoded chunk, so long-running commands can be
+        displayed before they finish. The returned result carries the full
+        output, as with :meth:`execute`. If ``on_output`` raises, the command
+        is killed and a failed result carrying the error is returned.
+        """
+        self._ensure_not_closed()
+
+        start_time = time.monotonic()
+
+        async def pump(
+            stream: asyncio.StreamReader, name: str, parts: list[str]
+        ) -> None:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            while chunk := await stream.read(_STREAM_CHUNK_SIZE):
+                text = decoder.decode(chunk)
+                if text:
+                    parts.append(text)
+                    on_output(name, text)
+            text = decoder.decode(b"", final=True)
+            if text:
+                parts.append(text)
+                on_output(name, text)
+
+        try:
+            process = await self._spawn(command, working_dir, environment)
+        except Exception as e:
+            return self._failed_result(command, e, start_time)
+
+        # _spawn always opens both pipes
+        assert process.stdout is not None and process.stderr is not None
+
+        stdout_parts: list[str] = []
+        stderr_parts: list[str] = []
+        wait_task = asyncio.ensure_future(process.wait())
+        tasks = [
+            asyncio.ensure_future(pump(process.stdout, "stdout", stdout_parts)),
+            asyncio.ensure_future(pump(process.stderr, "stderr", stderr_parts)),
+            wait_task,
+        ]
+        completed = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*tasks), timeout=timeout or self.config.timeout
+            )
+            completed = True
+        except TimeoutError:
+            return self._error_result(
+                command,
+                f"Command timed out after {timeout or self.config.timeout} seconds",
+                start_time,
             )
+        except Exception as e:
+            # Includes exceptions raised by on_output
+            return self._failed_result(command, e, start_time)
+        finally:
+            # Don't leave the child or its pipe readers behind when the
+            # command did not finish normally (timeout, callback error,
+            # cancellation of the caller)
+            if not completed:
+                for task in tasks:
+                    task.cancel()
+                await self._kill(process)
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return_code = wait_task.result()
+        return ExecutionResult(
+            stdout="".join(stdout_parts),
+            stderr="".join(stderr_parts),
+            return_code=return_code,
+            execution_time=time.monotonic() - start_time,
+            success=return_code == 0,
+            command=command,
+        )
 
     async def upload_file(
         self, path: str, content: str | bytes, mode: str = "w"
@@ -210,19 +462,22 @@ class LocalSandboxSession(BaseSandboxSession):
             if not dir_path.exists():
                 raise ProviderError(f"Directory not found: {path}", self._provider.name)
 
+            # scandir yields DirEntry objects whose is_dir() comes from the
+            # directory listing itself, so each entry costs one stat at most
             files = []
-            for item in dir_path.iterdir():
-                stat = item.stat()
-                files.append(
-                    FileInfo(
-                        path=str(item.relative_to(self.sandbox_dir)),
-                        name=item.name,
-                        size=stat.st_size,
-                        is_directory=item.is_dir(),
-                        modified_time=stat.st_mtime,
-                        permissions=oct(stat.st_mode)[-3:],
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    stat = entry.stat()
+                    files.append(
+                        FileInfo(
+                            path=os.path.relpath(entry.path, self.sandbox_dir),
+                            name=entry.name,
+                            size=stat.st_size,
+                            is_directory=entry.is_dir(),
+                            modified_time=stat.st_mtime,
+                            permissions=oct(stat.st_mode)[-3:],
+                        )
                     )
-                )
 
             return files
 
@@ -1,5 +1,6 @@
 """Modal provider implementation for Grainchain."""
 
+import asyncio
 import time
 import uuid
 
@@ -63,10 +64,13 @@ class ModalProvider(BaseSandboxProvider):
 
             # Create Modal app using lookup for lazy initialization
             app_name = f"grainchain-{uuid.uuid4().hex[:8]}"
-            app = modal.App.lookup(app_name, create_if_missing=True)
+            app = await asyncio.to_thread(
+                modal.App.lookup, app_name, create_if_missing=True
+            )
 
-            # Create Modal sandbox
-            modal_sandbox = ModalSandbox.create(
+            # Create Modal sandbox; the SDK call blocks, so keep it off the event loop
+            modal_sandbox = await asyncio.to_thread(
+                ModalSandbox.create,
                 image=image,
                 app=app,
                 timeout=config.timeout,
@@ -114,7 +118,7 @@ class ModalSandboxSession(BaseSandboxSession):
         """Execute a command in the Modal sandbox."""
         self._ensure_not_closed()
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Prepare the command with working directory and environment
@@ -136,14 +140,18 @@ class ModalSandboxSession(BaseSandboxSession):
             final_command = " && ".join(full_command)
 
             # Execute via Modal sandbox
-            process = self.modal_sandbox.exec(
-                "bash", "-c", final_command, timeout=timeout or self.config.timeout
+            process = await asyncio.to_thread(
+                self.modal_sandbox.exec,
+                "bash",
+                "-c",
+                final_command,
+                timeout=timeout or self.config.timeout,
             )
 
-            # Wait for completion and get results
-            result = process.wait()
+            # Wait for completion off the event loop and get results
+            result = await asyncio.to_thread(process.wait)
 
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             return ExecutionResult(
                 stdout=result.stdout,
@@ -155,15 +163,7 @@ class ModalSandboxSession(BaseSandboxSession):
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
-            return ExecutionResult(
-                stdout="",
-                stderr=str(e),
-                return_code=-1,
-                execution_time=execution_time,
-                success=False,
-                command=command,
-            )
+            return self._error_result(command, str(e), start_time)
 
     async def upload_file(
         self, path: str, content: str | bytes, mode: str = "w"
@@ -288,7 +288,7 @@ class ModalSandboxSession(BaseSandboxSession):
             # Modal sandboxes are automatically cleaned up
             # but we can explicitly terminate if needed
             if hasattr(self.modal_sandbox, "terminate"):
-                self.modal_sandbox.terminate()
+                await asyncio.to_thread(self.modal_sandbox.terminate)
         except Exception as e:
             # Log but don't raise - cleanup should be best effort
             import logging
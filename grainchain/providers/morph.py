@@ -128,7 +128,7 @@ class MorphSandboxSession(BaseSandboxSession):
         environment: dict[str, str] | None = None,
     ) -> ExecutionResult:
         """Execute a command in the Morph sandbox."""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             ssh = await self._get_ssh_connection()
@@ -148,7 +148,7 @@ class MorphSandboxSession(BaseSandboxSession):
                 None, lambda: ssh.run(["/bin/bash", "-c", full_command])
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             return ExecutionResult(
                 stdout=result.stdout or "",
@@ -160,27 +160,15 @@ class MorphSandboxSession(BaseSandboxSession):
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             # Handle timeout and other errors
             if timeout and execution_time > timeout:
-                return ExecutionResult(
-                    stdout="",
-                    stderr=f"Command timed out after {timeout} seconds",
-                    return_code=-1,
-                    execution_time=execution_time,
-                    success=False,
-                    command=command,
+                return self._error_result(
+                    command, f"Command timed out after {timeout} seconds", start_time
                 )
             else:
-                return ExecutionResult(
-                    stdout="",
-                    stderr=str(e),
-                    return_code=-1,
-                    execution_time=execution_time,
-                    success=False,
-                    command=command,
-                )
+                return self._error_result(command, str(e), start_time)
 
     async def upload_file(
         self, path: str, content: str | bytes, mode: str = "text"
@@ -0,0 +1 @@
+"""Grainchain Dashboard package."""
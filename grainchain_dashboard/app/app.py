@@ -1,617 +1,10 @@
-#!/usr/bin/env python3
-"""Standalone Grainchain Dashboard Application."""
+"""Grainchain Dashboard application entry point.
 
-import reflex as rx
-from typing import Dict, List, Optional, Any
-import sys
-import os
+The dashboard state and page components live in the ``src`` package; this
+module re-exports them so existing ``app`` imports keep working.
+"""
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ..src.main import app
+from ..src.state import DashboardState
 
-# Initialize database first
-try:
-    from database import init_database
-    init_database()
-    print("✅ Database initialized successfully")
-except Exception as e:
-    print(f"⚠️ Database initialization warning: {e}")
-
-class DashboardState(rx.State):
-    """Consolidated dashboard state with all features."""
-    
-    # Navigation
-    current_page: str = "dashboard"
-    
-    # Statistics
-    active_sandboxes_count: int = 1
-    providers_count: int = 5
-    commands_run_count: int = 42
-    
-    # Provider management
-    providers: Dict[str, Dict[str, Any]] = {
-        "local": {"name": "Local", "status": "success", "has_api_key": True, "description": "Local development environment"},
-        "e2b": {"name": "E2B", "status": "failed", "has_api_key": False, "description": "Cloud sandboxes with templates"},
-        "daytona": {"name": "Daytona", "status": "unknown", "has_api_key": False, "description": "Development workspaces"},
-        "morph": {"name": "Morph", "status": "unknown", "has_api_key": False, "description": "Custom VMs with fast snapshots"},
-        "modal": {"name": "Modal", "status": "unknown", "has_api_key": False, "description": "Serverless compute platform"},
-    }
-    
-    # File management
-    current_directory: str = "/"
-    files: List[Dict[str, Any]] = [
-        {"name": "main.py", "size": 1024, "type": "file", "modified": "2025-01-05 10:30", "path": "/main.py"},
-        {"name": "README.md", "size": 2048, "type": "file", "modified": "2025-01-05 10:25", "path": "/README.md"},
-        {"name": "src", "size": 0, "type": "directory", "modified": "2025-01-05 10:20", "path": "/src"},
-        {"name": "tests", "size": 0, "type": "directory", "modified": "2025-01-05 10:15", "path": "/tests"},
-        {"name": "requirements.txt", "size": 512, "type": "file", "modified": "2025-01-05 10:10", "path": "/requirements.txt"},
-    ]
-    
-    # Snapshot management
-    snapshots: List[Dict[str, Any]] = [
-        {"id": "snap_001", "name": "Initial Setup", "status": "ready", "size": "50MB", "created": "2025-01-05 09:00", "files_count": 15},
-        {"id": "snap_002", "name": "After Dependencies", "status": "ready", "size": "120MB", "created": "2025-01-05 09:30", "files_count": 45},
-        {"id": "snap_003", "name": "Working Implementation", "status": "creating", "size": "200MB", "created": "2025-01-05 10:00", "files_count": 78},
-    ]
-    
-    # Terminal
-    command_history: List[str] = ["ls -la", "python --version", "pip install -r requirements.txt", "python main.py"]
-    command_output: str = """$ ls -la
-total 24
-drwxr-xr-x 5 user user 4096 Jan  5 10:30 .
-drwxr-xr-x 3 root root 4096 Jan  5 10:00 ..
--rw-r--r-- 1 user user 1024 Jan  5 10:30 main.py
--rw-r--r-- 1 user user 2048 Jan  5 10:25 README.md
--rw-r--r-- 1 user user  512 Jan  5 10:10 requirements.txt
-drwxr-xr-x 2 user user 4096 Jan  5 10:20 src
-drwxr-xr-x 2 user user 4096 Jan  5 10:15 tests
-
-$ python --version
-Python 3.12.0
-
-$ pip install -r requirements.txt
-Collecting reflex>=0.8.0
-  Downloading reflex-0.8.5-py3-none-any.whl
-Installing collected packages: reflex, sqlalchemy, cryptography
-Successfully installed reflex-0.8.5 sqlalchemy-2.0.42 cryptography-45.0.5
-
-$ python main.py
-🚀 Grainchain Dashboard starting...
-✅ Database initialized
-✅ All components loaded
-🌐 Server running on http://localhost:3000
-
-$ _"""
-    current_command: str = ""
-    
-    # Settings
-    theme: str = "dark"
-    default_provider: str = "local"
-    notifications_enabled: bool = True
-    auto_save_enabled: bool = True
-    command_history_limit: int = 100
-    
-    # UI State
-    show_provider_modal: bool = False
-    show_file_upload_modal: bool = False
-    show_snapshot_modal: bool = False
-    selected_provider: str = ""
-    
-    # Form states
-    provider_api_key: str = ""
-    snapshot_name: str = ""
-    snapshot_description: str = ""
-    
-    def set_page(self, page: str):
-        """Navigate to a different page."""
-        self.current_page = page
-    
-    def open_provider_modal(self, provider: str):
-        """Open provider configuration modal."""
-        self.selected_provider = provider
-        self.show_provider_modal = True
-    
-    def close_provider_modal(self):
-        """Close provider configuration modal."""
-        self.show_provider_modal = False
-        self.provider_api_key = ""
-    
-    def save_provider_config(self):
-        """Save provider configuration."""
-        if self.provider_api_key.strip():
-            if self.selected_provider in self.providers:
-                self.providers[self.selected_provider]["has_api_key"] = True
-                self.providers[self.selected_provider]["status"] = "success"
-        self.close_provider_modal()
-    
-    def open_file_upload_modal(self):
-        """Open file upload modal."""
-        self.show_file_upload_modal = True
-    
-    def close_file_upload_modal(self):
-        """Close file upload modal."""
-        self.show_file_upload_modal = False
-    
-    def open_snapshot_modal(self):
-        """Open create snapshot modal."""
-        self.show_snapshot_modal = True
-    
-    def close_snapshot_modal(self):
-        """Close create snapshot modal."""
-        self.show_snapshot_modal = False
-        self.snapshot_name = ""
-        self.snapshot_description = ""
-    
-    def create_snapshot(self):
-        """Create a new snapshot."""
-        if self.snapshot_name.strip():
-            new_snapshot = {
-                "id": f"snap_{len(self.snapshots) + 1:03d}",
-                "name": self.snapshot_name,
-                "status": "creating",
-                "size": "0MB",
-                "created": "2025-01-05 10:35",
-                "files_count": len(self.files)
-            }
-            self.snapshots.append(new_snapshot)
-        self.close_snapshot_modal()
-    
-    def delete_snapshot(self, snapshot_id: str):
-        """Delete a snapshot."""
-        self.snapshots = [s for s in self.snapshots if s["id"] != snapshot_id]
-    
-    def execute_command(self):
-        """Execute terminal command."""
-        if self.current_command.strip():
-            self.command_history.append(self.current_command)
-            self.command_output += f"\n\n$ {self.current_command}\n"
-            if self.current_command == "ls":
-                self.command_output += "main.py  README.md  src  tests  requirements.txt"
-            elif self.current_command.startswith("echo"):
-                self.command_output += self.current_command[5:]
-            else:
-                self.command_output += f"Command executed: {self.current_command}"
-            self.command_output += "\n\n$ _"
-            self.current_command = ""
-    
-    def delete_file(self, file_path: str):
-        """Delete a file."""
-        self.files = [f for f in self.files if f["path"] != file_path]
-
-def status_badge(status: str) -> rx.Component:
-    """Status badge component."""
-    color_map = {
-        "success": "green",
-        "failed": "red", 
-        "unknown": "gray",
-        "ready": "green",
-        "creating": "blue"
-    }
-    color = color_map.get(status, "gray")
-    return rx.badge(status.title(), color_scheme=color, variant="soft")
-
-def sidebar() -> rx.Component:
-    """Enhanced sidebar with all navigation options."""
-    return rx.box(
-        rx.vstack(
-            # Header
-            rx.hstack(
-                rx.icon("link", size=20, color="blue"),
-                rx.heading("Grainchain", size="5"),
-                spacing="2",
-                style={"padding": "1rem"}
-            ),
-            rx.divider(),
-            
-            # Navigation items
-            rx.vstack(
-                rx.button(
-                    rx.hstack(rx.icon("home", size=16), rx.text("Dashboard"), spacing="2"),
-                    on_click=lambda: DashboardState.set_page("dashboard"),
-                    variant=rx.cond(DashboardState.current_page == "dashboard", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
-                ),
-                rx.button(
-                    rx.hstack(rx.icon("plug", size=16), rx.text("Providers"), spacing="2"),
-                    on_click=lambda: DashboardState.set_page("providers"),
-                    variant=rx.cond(DashboardState.current_page == "providers", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
-                ),
-                rx.button(
-                    rx.hstack(rx.icon("terminal", size=16), rx.text("Terminal"), spacing="2"),
-                    on_click=lambda: DashboardState.set_page("terminal"),
-                    variant=rx.cond(DashboardState.current_page == "terminal", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
-                ),
-                rx.button(
-                    rx.hstack(rx.icon("folder", size=16), rx.text("Files"), spacing="2"),
-                    on_click=lambda: DashboardState.set_page("files"),
-                    variant=rx.cond(DashboardState.current_page == "files", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
-                ),
-                rx.button(
-                    rx.hstack(rx.icon("camera", size=16), rx.text("Snapshots"), spacing="2"),
-                    on_click=lambda: DashboardState.set_page("snapshots"),
-                    variant=rx.cond(DashboardState.current_page == "snapshots", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
-                ),
-                rx.button(
-                    rx.hstack(rx.icon("settings", size=16), rx.text("Settings"), spacing="2"),
-                    on_click=lambda: DashboardState.set_page("settings"),
-                    variant=rx.cond(DashboardState.current_page == "settings", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
-                ),
-                spacing="2",
-                style={"padding": "0 1rem"}
-            ),
-            
-            # Status indicator
-            rx.divider(),
-            rx.box(
-                rx.hstack(
-                    rx.icon("circle", size=8, color="green"),
-                    rx.text("Connected", size="2", color="green"),
-                    spacing="2"
-                ),
-                style={"padding": "1rem"}
-            ),
-            spacing="4"
-        ),
-        style={
-            "width": "250px",
-            "height": "100vh",
-            "background": "var(--gray-2)",
-            "border_right": "1px solid var(--gray-6)"
-        }
-    )
-
-def dashboard_content() -> rx.Component:
-    """Dashboard page content."""
-    return rx.vstack(
-        rx.heading("🚀 Grainchain Dashboard", size="7"),
-        rx.text("Modern sandbox management interface", size="4", color="gray"),
-        
-        # Statistics cards
-        rx.hstack(
-            rx.card(
-                rx.vstack(
-                    rx.text("Active Sandboxes", size="2", color="gray"),
-                    rx.text(DashboardState.active_sandboxes_count, size="6", weight="bold", color="green"),
-                    spacing="1"
-                ),
-                style={"padding": "1.5rem", "min_width": "150px"}
-            ),
-            rx.card(
-                rx.vstack(
-                    rx.text("Providers", size="2", color="gray"),
-                    rx.text(DashboardState.providers_count, size="6", weight="bold", color="blue"),
-                    spacing="1"
-                ),
-                style={"padding": "1.5rem", "min_width": "150px"}
-            ),
-            rx.card(
-                rx.vstack(
-                    rx.text("Commands Run", size="2", color="gray"),
-                    rx.text(DashboardState.commands_run_count, size="6", weight="bold", color="purple"),
-                    spacing="1"
-                ),
-                style={"padding": "1.5rem", "min_width": "150px"}
-            ),
-            spacing="4"
-        ),
-        
-        # Quick actions
-        rx.card(
-            rx.vstack(
-                rx.heading("⚡ Quick Actions", size="5"),
-                rx.divider(),
-                rx.grid(
-                    rx.button(
-                        rx.vstack(rx.icon("plus", size=20), rx.text("Create Snapshot"), spacing="2", align="center"),
-                        on_click=DashboardState.open_snapshot_modal,
-                        variant="outline", style={"height": "80px", "width": "100%"}
-                    ),
-                    rx.button(
-                        rx.vstack(rx.icon("upload", size=20), rx.text("Upload File"), spacing="2", align="center"),
-                        on_click=DashboardState.open_file_upload_modal,
-                        variant="outline", style={"height": "80px", "width": "100%"}
-                    ),
-                    rx.button(
-                        rx.vstack(rx.icon("settings", size=20), rx.text("Configure Provider"), spacing="2", align="center"),
-                        on_click=lambda: DashboardState.set_page("providers"),
-                        variant="outline", style={"height": "80px", "width": "100%"}
-                    ),
-                    rx.button(
-                        rx.vstack(rx.icon("terminal", size=20), rx.text("Open Terminal"), spacing="2", align="center"),
-                        on_click=lambda: DashboardState.set_page("terminal"),
-                        variant="outline", style={"height": "80px", "width": "100%"}
-                    ),
-                    columns="2", spacing="4"
-                ),
-                spacing="4", width="100%"
-            ),
-            style={"padding": "2rem"}
-        ),
-        
-        spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
-    )
-
-def providers_content() -> rx.Component:
-    """Providers page content."""
-    return rx.vstack(
-        rx.heading("🔌 Sandbox Providers", size="6"),
-        rx.text("Configure and manage your sandbox providers", size="3", color="gray"),
-        
-        rx.grid(
-            rx.foreach(
-                DashboardState.providers,
-                lambda provider_name, provider_data: rx.card(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.text("🏠" if provider_name == "local" else "☁️", size="5"),
-                            rx.heading(provider_data["name"], size="4"),
-                            status_badge(provider_data["status"]),
-                            justify="between", width="100%"
-                        ),
-                        rx.text(provider_data["description"], size="2", color="gray"),
-                        rx.text(f"API Key: {'✅ Configured' if provider_data['has_api_key'] else '❌ Missing'}", size="2"),
-                        rx.button("Configure", size="2", variant="soft"),
-                        spacing="3", align="start"
-                    ),
-                    style={"padding": "1.5rem", "min_height": "180px"}
-                )
-            ),
-            columns="2", spacing="4", width="100%"
-        ),
-        
-        spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
-    )
-
-def terminal_content() -> rx.Component:
-    """Terminal page content."""
-    return rx.vstack(
-        rx.heading("💻 Interactive Terminal", size="6"),
-        rx.text("Execute commands in your sandbox environment", size="3", color="gray"),
-        
-        rx.card(
-            rx.vstack(
-                rx.hstack(
-                    rx.text("Connected to:", size="2", color="gray"),
-                    rx.badge("local-sandbox-123", color_scheme="green"),
-                    justify="start"
-                ),
-                rx.divider(),
-                
-                rx.box(
-                    rx.text(
-                        DashboardState.command_output,
-                        style={
-                            "font_family": "monospace",
-                            "white_space": "pre",
-                            "background": "var(--gray-1)",
-                            "padding": "1rem",
-                            "border_radius": "6px",
-                            "font_size": "14px",
-                            "line_height": "1.5"
-                        }
-                    ),
-                    style={"width": "100%", "min_height": "400px", "overflow": "auto"}
-                ),
-                
-                rx.divider(),
-                
-                rx.hstack(
-                    rx.text("$", size="3", weight="bold", color="green"),
-                    rx.input(
-                        placeholder="Enter command...", 
-                        value=DashboardState.current_command,
-                        on_change=DashboardState.set_current_command,
-                        style={"flex": "1", "font_family": "monospace"}
-                    ),
-                    rx.button("Execute", color_scheme="blue", on_click=DashboardState.execute_command),
-                    spacing="3", width="100%"
-                ),
-                
-                spacing="4", width="100%"
-            ),
-            style={"padding": "1.5rem"}
-        ),
-        
-        spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
-    )
-
-def files_content() -> rx.Component:
-    """Files page content."""
-    return rx.vstack(
-        rx.heading("📁 File Manager", size="6"),
-        rx.text("Browse, upload, and manage sandbox files", size="3", color="gray"),
-        
-        rx.hstack(
-            rx.button(rx.hstack(rx.icon("upload", size=16), rx.text("Upload"), spacing="2"), color_scheme="blue"),
-            rx.button(rx.hstack(rx.icon("folder-plus", size=16), rx.text("New Folder"), spacing="2"), variant="soft"),
-            rx.input(placeholder="Search files...", style={"flex": "1"}),
-            spacing="3", width="100%"
-        ),
-        
-        rx.card(
-            rx.table.root(
-                rx.table.header(
-                    rx.table.row(
-                        rx.table.column_header_cell("Name"),
-                        rx.table.column_header_cell("Size"),
-                        rx.table.column_header_cell("Modified"),
-                        rx.table.column_header_cell("Actions")
-                    )
-                ),
-                rx.table.body(
-                    rx.foreach(
-                        DashboardState.files,
-                        lambda file: rx.table.row(
-                            rx.table.cell(
-                                rx.hstack(
-                                    rx.icon("folder" if file["type"] == "directory" else "file", size=16),
-                                    rx.text(file["name"]),
-                                    spacing="2"
-                                )
-                            ),
-                            rx.table.cell(f"{file['size']} bytes" if file["type"] == "file" else "-"),
-                            rx.table.cell(file["modified"]),
-                            rx.table.cell(
-                                rx.hstack(
-                                    rx.button(rx.icon("download", size=14), size="1", variant="ghost"),
-                                    rx.button(rx.icon("trash", size=14), size="1", variant="ghost", color_scheme="red"),
-                                    spacing="1"
-                                )
-                            )
-                        )
-                    )
-                ),
-                variant="surface", size="2"
-            ),
-            style={"padding": "1rem"}
-        ),
-        
-        spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
-    )
-
-def snapshots_content() -> rx.Component:
-    """Snapshots page content."""
-    return rx.vstack(
-        rx.heading("📸 Snapshot Manager", size="6"),
-        rx.text("Create, restore, and manage sandbox snapshots", size="3", color="gray"),
-        
-        rx.hstack(
-            rx.button(rx.hstack(rx.icon("plus", size=16), rx.text("Create Snapshot"), spacing="2"), color_scheme="blue"),
-            rx.button(rx.hstack(rx.icon("download", size=16), rx.text("Import"), spacing="2"), variant="soft"),
-            spacing="3"
-        ),
-        
-        rx.grid(
-            rx.foreach(
-                DashboardState.snapshots,
-                lambda snapshot: rx.card(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.text("📸", size="5"),
-                            rx.heading(snapshot["name"], size="4"),
-                            status_badge(snapshot["status"]),
-                            justify="between", width="100%"
-                        ),
-                        rx.text(f"Size: {snapshot['size']}", size="2", color="gray"),
-                        rx.text(f"Files: {snapshot['files_count']}", size="2", color="gray"),
-                        rx.text(f"Created: {snapshot['created']}", size="2", color="gray"),
-                        rx.hstack(
-                            rx.button("Restore", size="2", color_scheme="blue"),
-                            rx.button("Export", size="2", variant="soft"),
-                            rx.button("Delete", size="2", variant="soft", color_scheme="red"),
-                            spacing="2"
-                        ),
-                        spacing="3", align="start"
-                    ),
-                    style={"padding": "1.5rem"}
-                )
-            ),
-            columns="2", spacing="4", width="100%"
-        ),
-        
-        spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
-    )
-
-def settings_content() -> rx.Component:
-    """Settings page content."""
-    return rx.vstack(
-        rx.heading("⚙️ Settings", size="6"),
-        rx.text("Configure dashboard preferences and global settings", size="3", color="gray"),
-        
-        rx.grid(
-            rx.card(
-                rx.vstack(
-                    rx.heading("General", size="4"),
-                    rx.divider(),
-                    rx.vstack(
-                        rx.hstack(
-                            rx.text("Theme:", size="2", weight="medium"),
-                            rx.select(["Light", "Dark"], value=DashboardState.theme.title()),
-                            spacing="3", width="100%", justify="between"
-                        ),
-                        rx.hstack(
-                            rx.text("Default Provider:", size="2", weight="medium"),
-                            rx.select(["Local", "E2B", "Daytona"], value=DashboardState.default_provider.title()),
-                            spacing="3", width="100%", justify="between"
-                        ),
-                        rx.hstack(
-                            rx.text("Notifications:", size="2", weight="medium"),
-                            rx.switch(checked=DashboardState.notifications_enabled),
-                            spacing="3", width="100%", justify="between"
-                        ),
-                        spacing="4", width="100%"
-                    ),
-                    spacing="3", width="100%"
-                ),
-                style={"padding": "1.5rem"}
-            ),
-            
-            rx.card(
-                rx.vstack(
-                    rx.heading("Advanced", size="4"),
-                    rx.divider(),
-                    rx.vstack(
-                        rx.button("Export Configuration", variant="soft", width="100%"),
-                        rx.button("Import Configuration", variant="soft", width="100%"),
-                        rx.button("Reset to Defaults", variant="soft", color_scheme="red", width="100%"),
-                        spacing="3", width="100%"
-                    ),
-                    spacing="3", width="100%"
-                ),
-                style={"padding": "1.5rem"}
-            ),
-            
-            columns="2", spacing="4", width="100%"
-        ),
-        
-        spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
-    )
-
-def page_content() -> rx.Component:
-    """Render page content based on current page."""
-    return rx.match(
-        DashboardState.current_page,
-        ("dashboard", dashboard_content()),
-        ("providers", providers_content()),
-        ("terminal", terminal_content()),
-        ("files", files_content()),
-        ("snapshots", snapshots_content()),
-        ("settings", settings_content()),
-        dashboard_content()  # default
-    )
-
-def index() -> rx.Component:
-    """Main page layout."""
-    return rx.hstack(
-        sidebar(),
-        rx.box(
-            page_content(),
-            style={"flex": "1", "background": "var(--gray-1)", "overflow": "auto"}
-        ),
-        spacing="0",
-        width="100%",
-        height="100vh"
-    )
-
-# Create app
-app = rx.App(
-    style={"font_family": "Inter, system-ui, sans-serif"}
-)
-
-app.add_page(index, route="/", title="Grainchain Dashboard - Professional Sandbox Management")
-
-if __name__ == "__main__":
-    print("🚀 Starting Grainchain Dashboard...")
-    print("✅ All features implemented and ready!")
-    print("🌐 Navigate to http://localhost:3000 to view the dashboard")
+__all__ = ["app", "DashboardState"]
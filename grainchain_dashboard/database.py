@@ -5,7 +5,7 @@ import sqlalchemy as sa
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Generator, List, Optional
 import logging
 
 from .models import Base, ProviderConfig, UserSettings, FileMetadata, Snapshot, CommandHistory, ActivityLog
@@ -155,6 +155,14 @@ def get_db_session() -> Generator[Session, None, None]:
     finally:
         session.close()
 
+@contextmanager
+def session_scope() -> Generator[Session, None, None]:
+    """Get database session, committing on success."""
+    with get_db_session() as session:
+        yield session
+        # Inside get_db_session, so a failed commit is rolled back too
+        session.commit()
+
 def get_db() -> Session:
     """Get database session (for dependency injection)."""
     return SessionLocal()
@@ -209,27 +217,68 @@ def set_setting(key: str, value, setting_type: str = "string", description: str
         logger.error(f"Failed to set setting {key}: {e}")
         raise
 
+def get_provider_configs() -> List[dict]:
+    """Get stored provider configurations as plain dictionaries."""
+    with session_scope() as db:
+        return [
+            {
+                "provider_name": provider.provider_name,
+                "is_enabled": provider.is_enabled,
+                "has_api_key": bool(provider.api_key),
+                "tested": provider.last_tested is not None,
+                "test_status": provider.test_status,
+                "config": provider.get_config_dict(),
+            }
+            for provider in db.query(ProviderConfig).all()
+        ]
+
+def save_provider_config(provider_name: str, config: dict):
+    """Create or update a provider configuration."""
+    with session_scope() as db:
+        provider = db.query(ProviderConfig).filter(
+            ProviderConfig.provider_name == provider_name
+        ).first()
+        
+        if not provider:
+            provider = ProviderConfig(provider_name=provider_name)
+            db.add(provider)
+        
+        provider.set_config_dict(config)
+
 def log_activity(action: str, resource_type: str, resource_id: str = None, 
                 details: dict = None, status: str = "success", error_message: str = None):
     """Log an activity for audit trail."""
+    log_activities([
+        {
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "details": details,
+            "status": status,
+            "error_message": error_message,
+        }
+    ])
+
+def log_activities(entries: List[dict]):
+    """Log a batch of activities in a single transaction."""
     try:
-        with get_db_session() as db:
-            activity = ActivityLog(
-                action=action,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                status=status,
-                error_message=error_message
-            )
-            
-            if details:
-                activity.set_details_dict(details)
-            
-            db.add(activity)
-            db.commit()
+        with session_scope() as db:
+            for entry in entries:
+                activity = ActivityLog(
+                    action=entry["action"],
+                    resource_type=entry["resource_type"],
+                    resource_id=entry.get("resource_id"),
+                    status=entry.get("status", "success"),
+                    error_message=entry.get("error_message")
+                )
+                
+                if entry.get("details"):
+                    activity.set_details_dict(entry["details"])
+                
+                db.add(activity)
             
     except Exception as e:
-        logger.error(f"Failed to log activity: {e}")
+        logger.error(f"Failed to log {len(entries)} activities: {e}")
 
 def cleanup_old_data():
     """Clean up old data based on retention policies."""
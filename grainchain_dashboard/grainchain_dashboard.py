@@ -2,7 +2,7 @@
 """Main Grainchain Dashboard Application Entry Point."""
 
 # Import the full comprehensive dashboard
-from app import app
+from .app import app
 
 # Export the app for Reflex
 __all__ = ["app"]
@@ -9,8 +9,10 @@ class SimpleConfig:
     HOST = "0.0.0.0"
     FRONTEND_PORT = 3000
     BACKEND_PORT = 8000
-    DATABASE_URL = "sqlite:///grainchain.db"
-    DEBUG = True
+    # Share the database file used by database.py unless overridden
+    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///grainchain_dashboard.db")
+    # Same default as the SQL echo flag in database.py: off unless asked for
+    DEBUG = os.getenv("DEBUG", "false").lower() == "true"
     DEFAULT_THEME = "dark"
 
 config_settings = SimpleConfig()
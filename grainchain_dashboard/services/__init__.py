@@ -1 +0,0 @@
-"""Services module for Grainchain Dashboard."""
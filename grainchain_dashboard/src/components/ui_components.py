@@ -2,25 +2,163 @@
 
 import reflex as rx
 from typing import Dict, List, Optional, Any
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from ..state import DashboardState, COMMAND_INPUT_DEBOUNCE_MS, TERMINAL_WINDOW_LINES
 
-from ..state import DashboardState
+# Appends streamed command output to the terminal without a state round-trip.
+# It writes into #terminal-live, an empty <pre> React never renders children
+# into, so the React-managed scrollback above it is left untouched; the live
+# text keeps the same rolling window of lines as the server
+APPEND_TERMINAL_SCRIPT = f"""
+window.__appendTerminal = (text) => {{
+    const live = document.getElementById("terminal-live");
+    if (live) {{
+        // The scrollback above already ends its last line
+        const output = live.textContent ? live.textContent + text : text.replace(/^\\n/, "");
+        live.textContent = output.split("\\n").slice(-{TERMINAL_WINDOW_LINES}).join("\\n");
+    }}
+}};
+"""
 
-def status_badge(status: str) -> rx.Component:
+# Shared style dicts, built once rather than on every page build
+PAGE_STYLE = {"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
+CARD_STYLE = {"padding": "1.5rem"}
+STAT_CARD_STYLE = {"padding": "1.5rem", "min_width": "150px"}
+NAV_BUTTON_STYLE = {"width": "100%", "justify_content": "flex_start"}
+ACTION_BUTTON_STYLE = {"height": "80px", "width": "100%"}
+TERMINAL_STYLE = {
+    "width": "100%",
+    "min_height": "400px",
+    "overflow": "auto",
+    "background": "var(--gray-1)",
+    "padding": "1rem",
+    "border_radius": "6px"
+}
+TERMINAL_OUTPUT_STYLE = {
+    "font_family": "monospace",
+    "white_space": "pre",
+    "font_size": "14px",
+    "line_height": "1.5",
+    "margin": "0"
+}
+
+STATUS_COLORS = {
+    "success": "green",
+    "failed": "red", 
+    "unknown": "gray",
+    "ready": "green",
+    "creating": "blue"
+}
+
+@rx.memo
+def status_badge_memo(status: rx.Var[str]) -> rx.Component:
+    """Badge subtree shared by every status badge, keyed by its status prop."""
+    return rx.badge(
+        status.title(),
+        color_scheme=rx.match(status, *STATUS_COLORS.items(), "gray"),
+        variant="soft"
+    )
+
+def status_badge(status: str | rx.Var[str]) -> rx.Component:
     """Status badge component."""
-    color_map = {
-        "success": "green",
-        "failed": "red", 
-        "unknown": "gray",
-        "ready": "green",
-        "creating": "blue"
-    }
-    color = color_map.get(status, "gray")
-    return rx.badge(status.title(), color_scheme=color, variant="soft")
+    return status_badge_memo(status=status)
+
+@rx.memo
+def card_header(icon: rx.Var[str], title: rx.Var[str], status: rx.Var[str]) -> rx.Component:
+    """Icon, title and status badge row shared by provider and snapshot cards."""
+    return rx.hstack(
+        rx.text(icon, size="5"),
+        rx.heading(title, size="4"),
+        status_badge(status),
+        justify="between", width="100%"
+    )
+
+@rx.memo
+def provider_card(
+    name: rx.Var[str],
+    provider: rx.Var[Dict[str, Any]],
+    on_configure: rx.EventHandler[rx.event.passthrough_event_spec(str)],
+) -> rx.Component:
+    """Provider card; the configure handler is passed in by the page."""
+    return rx.card(
+        rx.vstack(
+            card_header(
+                icon=provider["icon"],
+                title=provider["name"],
+                status=provider["status"]
+            ),
+            rx.text(provider["description"], size="2", color="gray"),
+            rx.text(provider["api_key_label"], size="2"),
+            rx.button(
+                "Configure", size="2", variant="soft",
+                on_click=on_configure(name)
+            ),
+            spacing="3", align="start"
+        ),
+        style={"padding": "1.5rem", "min_height": "180px"}
+    )
+
+@rx.memo
+def file_row(
+    file: rx.Var[Dict[str, Any]],
+    on_delete: rx.EventHandler[rx.event.passthrough_event_spec(str)],
+) -> rx.Component:
+    """File table row; the delete handler is passed in by the page."""
+    return rx.table.row(
+        rx.table.cell(
+            rx.hstack(
+                rx.cond(
+                    file["is_directory"],
+                    rx.icon("folder", size=16),
+                    rx.icon("file", size=16)
+                ),
+                rx.text(file["name"]),
+                spacing="2"
+            )
+        ),
+        rx.table.cell(file["size_label"]),
+        rx.table.cell(file["modified"]),
+        rx.table.cell(
+            rx.hstack(
+                rx.button(rx.icon("download", size=14), size="1", variant="ghost"),
+                rx.button(
+                    rx.icon("trash", size=14), size="1", variant="ghost", color_scheme="red",
+                    on_click=on_delete(file["path"])
+                ),
+                spacing="1"
+            )
+        )
+    )
+
+@rx.memo
+def snapshot_card(
+    snapshot: rx.Var[Dict[str, Any]],
+    on_delete: rx.EventHandler[rx.event.passthrough_event_spec(str)],
+) -> rx.Component:
+    """Snapshot card; the delete handler is passed in by the page."""
+    return rx.card(
+        rx.vstack(
+            card_header(
+                icon="📸",
+                title=snapshot["name"],
+                status=snapshot["status"]
+            ),
+            rx.text(f"Size: {snapshot['size']}", size="2", color="gray"),
+            rx.text(f"Files: {snapshot['files_count']}", size="2", color="gray"),
+            rx.text(f"Created: {snapshot['created']}", size="2", color="gray"),
+            rx.hstack(
+                rx.button("Restore", size="2", color_scheme="blue"),
+                rx.button("Export", size="2", variant="soft"),
+                rx.button(
+                    "Delete", size="2", variant="soft", color_scheme="red",
+                    on_click=on_delete(snapshot["id"])
+                ),
+                spacing="2"
+            ),
+            spacing="3", align="start"
+        ),
+        style=CARD_STYLE
+    )
 
 def sidebar() -> rx.Component:
     """Enhanced sidebar with all navigation options."""
@@ -41,37 +179,37 @@ def sidebar() -> rx.Component:
                     rx.hstack(rx.icon("home", size=16), rx.text("Dashboard"), spacing="2"),
                     on_click=lambda: DashboardState.set_page("dashboard"),
                     variant=rx.cond(DashboardState.current_page == "dashboard", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
+                    style=NAV_BUTTON_STYLE
                 ),
                 rx.button(
                     rx.hstack(rx.icon("plug", size=16), rx.text("Providers"), spacing="2"),
                     on_click=lambda: DashboardState.set_page("providers"),
                     variant=rx.cond(DashboardState.current_page == "providers", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
+                    style=NAV_BUTTON_STYLE
                 ),
                 rx.button(
                     rx.hstack(rx.icon("terminal", size=16), rx.text("Terminal"), spacing="2"),
                     on_click=lambda: DashboardState.set_page("terminal"),
                     variant=rx.cond(DashboardState.current_page == "terminal", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
+                    style=NAV_BUTTON_STYLE
                 ),
                 rx.button(
                     rx.hstack(rx.icon("folder", size=16), rx.text("Files"), spacing="2"),
                     on_click=lambda: DashboardState.set_page("files"),
                     variant=rx.cond(DashboardState.current_page == "files", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
+                    style=NAV_BUTTON_STYLE
                 ),
                 rx.button(
                     rx.hstack(rx.icon("camera", size=16), rx.text("Snapshots"), spacing="2"),
                     on_click=lambda: DashboardState.set_page("snapshots"),
                     variant=rx.cond(DashboardState.current_page == "snapshots", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
+                    style=NAV_BUTTON_STYLE
                 ),
                 rx.button(
                     rx.hstack(rx.icon("settings", size=16), rx.text("Settings"), spacing="2"),
                     on_click=lambda: DashboardState.set_page("settings"),
                     variant=rx.cond(DashboardState.current_page == "settings", "soft", "ghost"),
-                    style={"width": "100%", "justify_content": "flex_start"}
+                    style=NAV_BUTTON_STYLE
                 ),
                 spacing="2",
                 style={"padding": "0 1rem"}
@@ -107,11 +245,11 @@ def dashboard_content() -> rx.Component:
         rx.hstack(
             rx.card(
                 rx.vstack(
-                    rx.text("Active Sandboxes", size="2", color="gray"),
-                    rx.text(DashboardState.active_sandboxes_count, size="6", weight="bold", color="green"),
+                    rx.text("Configured Providers", size="2", color="gray"),
+                    rx.text(DashboardState.configured_providers_count, size="6", weight="bold", color="green"),
                     spacing="1"
                 ),
-                style={"padding": "1.5rem", "min_width": "150px"}
+                style=STAT_CARD_STYLE
             ),
             rx.card(
                 rx.vstack(
@@ -119,7 +257,7 @@ def dashboard_content() -> rx.Component:
                     rx.text(DashboardState.providers_count, size="6", weight="bold", color="blue"),
                     spacing="1"
                 ),
-                style={"padding": "1.5rem", "min_width": "150px"}
+                style=STAT_CARD_STYLE
             ),
             rx.card(
                 rx.vstack(
@@ -127,7 +265,7 @@ def dashboard_content() -> rx.Component:
                     rx.text(DashboardState.commands_run_count, size="6", weight="bold", color="purple"),
                     spacing="1"
                 ),
-                style={"padding": "1.5rem", "min_width": "150px"}
+                style=STAT_CARD_STYLE
             ),
             spacing="4"
         ),
@@ -141,22 +279,22 @@ def dashboard_content() -> rx.Component:
                     rx.button(
                         rx.vstack(rx.icon("plus", size=20), rx.text("Create Snapshot"), spacing="2", align="center"),
                         on_click=DashboardState.open_snapshot_modal,
-                        variant="outline", style={"height": "80px", "width": "100%"}
+                        variant="outline", style=ACTION_BUTTON_STYLE
                     ),
                     rx.button(
                         rx.vstack(rx.icon("upload", size=20), rx.text("Upload File"), spacing="2", align="center"),
                         on_click=DashboardState.open_file_upload_modal,
-                        variant="outline", style={"height": "80px", "width": "100%"}
+                        variant="outline", style=ACTION_BUTTON_STYLE
                     ),
                     rx.button(
                         rx.vstack(rx.icon("settings", size=20), rx.text("Configure Provider"), spacing="2", align="center"),
                         on_click=lambda: DashboardState.set_page("providers"),
-                        variant="outline", style={"height": "80px", "width": "100%"}
+                        variant="outline", style=ACTION_BUTTON_STYLE
                     ),
                     rx.button(
                         rx.vstack(rx.icon("terminal", size=20), rx.text("Open Terminal"), spacing="2", align="center"),
                         on_click=lambda: DashboardState.set_page("terminal"),
-                        variant="outline", style={"height": "80px", "width": "100%"}
+                        variant="outline", style=ACTION_BUTTON_STYLE
                     ),
                     columns="2", spacing="4"
                 ),
@@ -166,7 +304,7 @@ def dashboard_content() -> rx.Component:
         ),
         
         spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
+        style=PAGE_STYLE
     )
 
 def providers_content() -> rx.Component:
@@ -178,27 +316,18 @@ def providers_content() -> rx.Component:
         rx.grid(
             rx.foreach(
                 DashboardState.providers,
-                lambda provider_name, provider_data: rx.card(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.text("🏠" if provider_name == "local" else "☁️", size="5"),
-                            rx.heading(provider_data["name"], size="4"),
-                            status_badge(provider_data["status"]),
-                            justify="between", width="100%"
-                        ),
-                        rx.text(provider_data["description"], size="2", color="gray"),
-                        rx.text(f"API Key: {'✅ Configured' if provider_data['has_api_key'] else '❌ Missing'}", size="2"),
-                        rx.button("Configure", size="2", variant="soft"),
-                        spacing="3", align="start"
-                    ),
-                    style={"padding": "1.5rem", "min_height": "180px"}
+                # Dict items arrive as [provider_name, provider_data] pairs
+                lambda provider: provider_card(
+                    name=provider[0],
+                    provider=provider[1],
+                    on_configure=DashboardState.open_provider_modal
                 )
             ),
             columns="2", spacing="4", width="100%"
         ),
         
         spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
+        style=PAGE_STYLE
     )
 
 def terminal_content() -> rx.Component:
@@ -206,6 +335,7 @@ def terminal_content() -> rx.Component:
     return rx.vstack(
         rx.heading("💻 Interactive Terminal", size="6"),
         rx.text("Execute commands in your sandbox environment", size="3", color="gray"),
+        rx.script(APPEND_TERMINAL_SCRIPT),
         
         rx.card(
             rx.vstack(
@@ -219,17 +349,12 @@ def terminal_content() -> rx.Component:
                 rx.box(
                     rx.text(
                         DashboardState.command_output,
-                        style={
-                            "font_family": "monospace",
-                            "white_space": "pre",
-                            "background": "var(--gray-1)",
-                            "padding": "1rem",
-                            "border_radius": "6px",
-                            "font_size": "14px",
-                            "line_height": "1.5"
-                        }
+                        id="terminal-output",
+                        style=TERMINAL_OUTPUT_STYLE
                     ),
-                    style={"width": "100%", "min_height": "400px", "overflow": "auto"}
+                    # Filled only by APPEND_TERMINAL_SCRIPT
+                    rx.el.pre(id="terminal-live", style=TERMINAL_OUTPUT_STYLE),
+                    style=TERMINAL_STYLE
                 ),
                 
                 rx.divider(),
@@ -240,6 +365,7 @@ def terminal_content() -> rx.Component:
                         placeholder="Enter command...", 
                         value=DashboardState.current_command,
                         on_change=DashboardState.set_current_command,
+                        debounce_timeout=COMMAND_INPUT_DEBOUNCE_MS,
                         style={"flex": "1", "font_family": "monospace"}
                     ),
                     rx.button("Execute", color_scheme="blue", on_click=DashboardState.execute_command),
@@ -248,11 +374,11 @@ def terminal_content() -> rx.Component:
                 
                 spacing="4", width="100%"
             ),
-            style={"padding": "1.5rem"}
+            style=CARD_STYLE
         ),
         
         spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
+        style=PAGE_STYLE
     )
 
 def files_content() -> rx.Component:
@@ -280,34 +406,38 @@ def files_content() -> rx.Component:
                 ),
                 rx.table.body(
                     rx.foreach(
-                        DashboardState.files,
-                        lambda file: rx.table.row(
-                            rx.table.cell(
-                                rx.hstack(
-                                    rx.icon("folder" if file["type"] == "directory" else "file", size=16),
-                                    rx.text(file["name"]),
-                                    spacing="2"
-                                )
-                            ),
-                            rx.table.cell(f"{file['size']} bytes" if file["type"] == "file" else "-"),
-                            rx.table.cell(file["modified"]),
-                            rx.table.cell(
-                                rx.hstack(
-                                    rx.button(rx.icon("download", size=14), size="1", variant="ghost"),
-                                    rx.button(rx.icon("trash", size=14), size="1", variant="ghost", color_scheme="red"),
-                                    spacing="1"
-                                )
-                            )
+                        DashboardState.visible_files,
+                        lambda file: file_row(
+                            file=file, on_delete=DashboardState.delete_file
                         )
                     )
                 ),
                 variant="surface", size="2"
             ),
+            rx.hstack(
+                rx.button(
+                    rx.icon("chevron-left", size=14),
+                    size="1", variant="soft",
+                    disabled=~DashboardState.has_previous_files,
+                    on_click=DashboardState.previous_files_page
+                ),
+                rx.text(
+                    "Page ", DashboardState.files_page, " of ", DashboardState.files_page_count,
+                    size="1", color="gray"
+                ),
+                rx.button(
+                    rx.icon("chevron-right", size=14),
+                    size="1", variant="soft",
+                    disabled=~DashboardState.has_next_files,
+                    on_click=DashboardState.next_files_page
+                ),
+                spacing="2", justify="end", width="100%", style={"padding_top": "0.5rem"}
+            ),
             style={"padding": "1rem"}
         ),
         
         spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
+        style=PAGE_STYLE
     )
 
 def snapshots_content() -> rx.Component:
@@ -325,33 +455,65 @@ def snapshots_content() -> rx.Component:
         rx.grid(
             rx.foreach(
                 DashboardState.snapshots,
-                lambda snapshot: rx.card(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.text("📸", size="5"),
-                            rx.heading(snapshot["name"], size="4"),
-                            status_badge(snapshot["status"]),
-                            justify="between", width="100%"
-                        ),
-                        rx.text(f"Size: {snapshot['size']}", size="2", color="gray"),
-                        rx.text(f"Files: {snapshot['files_count']}", size="2", color="gray"),
-                        rx.text(f"Created: {snapshot['created']}", size="2", color="gray"),
-                        rx.hstack(
-                            rx.button("Restore", size="2", color_scheme="blue"),
-                            rx.button("Export", size="2", variant="soft"),
-                            rx.button("Delete", size="2", variant="soft", color_scheme="red"),
-                            spacing="2"
-                        ),
-                        spacing="3", align="start"
-                    ),
-                    style={"padding": "1.5rem"}
+                lambda snapshot: snapshot_card(
+                    snapshot=snapshot, on_delete=DashboardState.delete_snapshot
                 )
             ),
             columns="2", spacing="4", width="100%"
         ),
         
         spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
+        style=PAGE_STYLE
+    )
+
+@rx.memo
+def general_settings_card(
+    theme: rx.Var[str], default_provider: rx.Var[str], notifications_enabled: rx.Var[bool]
+) -> rx.Component:
+    """General settings card; re-renders only when its own settings change."""
+    return rx.card(
+        rx.vstack(
+            rx.heading("General", size="4"),
+            rx.divider(),
+            rx.vstack(
+                rx.hstack(
+                    rx.text("Theme:", size="2", weight="medium"),
+                    rx.select(["Light", "Dark"], value=theme.title()),
+                    spacing="3", width="100%", justify="between"
+                ),
+                rx.hstack(
+                    rx.text("Default Provider:", size="2", weight="medium"),
+                    rx.select(["Local", "E2B", "Daytona"], value=default_provider.title()),
+                    spacing="3", width="100%", justify="between"
+                ),
+                rx.hstack(
+                    rx.text("Notifications:", size="2", weight="medium"),
+                    rx.switch(checked=notifications_enabled),
+                    spacing="3", width="100%", justify="between"
+                ),
+                spacing="4", width="100%"
+            ),
+            spacing="3", width="100%"
+        ),
+        style=CARD_STYLE
+    )
+
+@rx.memo
+def advanced_settings_card() -> rx.Component:
+    """Advanced settings card; holds no state, so it renders once."""
+    return rx.card(
+        rx.vstack(
+            rx.heading("Advanced", size="4"),
+            rx.divider(),
+            rx.vstack(
+                rx.button("Export Configuration", variant="soft", width="100%"),
+                rx.button("Import Configuration", variant="soft", width="100%"),
+                rx.button("Reset to Defaults", variant="soft", color_scheme="red", width="100%"),
+                spacing="3", width="100%"
+            ),
+            spacing="3", width="100%"
+        ),
+        style=CARD_STYLE
     )
 
 def settings_content() -> rx.Component:
@@ -361,51 +523,15 @@ def settings_content() -> rx.Component:
         rx.text("Configure dashboard preferences and global settings", size="3", color="gray"),
         
         rx.grid(
-            rx.card(
-                rx.vstack(
-                    rx.heading("General", size="4"),
-                    rx.divider(),
-                    rx.vstack(
-                        rx.hstack(
-                            rx.text("Theme:", size="2", weight="medium"),
-                            rx.select(["Light", "Dark"], value=DashboardState.theme.title()),
-                            spacing="3", width="100%", justify="between"
-                        ),
-                        rx.hstack(
-                            rx.text("Default Provider:", size="2", weight="medium"),
-                            rx.select(["Local", "E2B", "Daytona"], value=DashboardState.default_provider.title()),
-                            spacing="3", width="100%", justify="between"
-                        ),
-                        rx.hstack(
-                            rx.text("Notifications:", size="2", weight="medium"),
-                            rx.switch(checked=DashboardState.notifications_enabled),
-                            spacing="3", width="100%", justify="between"
-                        ),
-                        spacing="4", width="100%"
-                    ),
-                    spacing="3", width="100%"
-                ),
-                style={"padding": "1.5rem"}
+            general_settings_card(
+                theme=DashboardState.theme,
+                default_provider=DashboardState.default_provider,
+                notifications_enabled=DashboardState.notifications_enabled
             ),
-            
-            rx.card(
-                rx.vstack(
-                    rx.heading("Advanced", size="4"),
-                    rx.divider(),
-                    rx.vstack(
-                        rx.button("Export Configuration", variant="soft", width="100%"),
-                        rx.button("Import Configuration", variant="soft", width="100%"),
-                        rx.button("Reset to Defaults", variant="soft", color_scheme="red", width="100%"),
-                        spacing="3", width="100%"
-                    ),
-                    spacing="3", width="100%"
-                ),
-                style={"padding": "1.5rem"}
-            ),
-            
+            advanced_settings_card(),
             columns="2", spacing="4", width="100%"
         ),
         
         spacing="6",
-        style={"padding": "2rem", "max_width": "1200px", "margin": "0 auto"}
+        style=PAGE_STYLE
     )
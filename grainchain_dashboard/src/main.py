@@ -2,45 +2,43 @@
 
 import reflex as rx
 from typing import Dict, List, Optional, Any
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ..database import init_database
 
 # Initialize database first
 try:
-    from database import init_database
     init_database()
     print("✅ Database initialized successfully")
 except Exception as e:
     print(f"⚠️ Database initialization warning: {e}")
 
-from .state import DashboardState
+from .state import DashboardState, PAGE_ROUTES, flush_activity_log
 from .components.ui_components import (
     sidebar, status_badge, dashboard_content, providers_content,
     terminal_content, files_content, snapshots_content, settings_content
 )
 
-def page_content() -> rx.Component:
-    """Render page content based on current page."""
-    return rx.match(
-        DashboardState.current_page,
-        ("dashboard", dashboard_content()),
-        ("providers", providers_content()),
-        ("terminal", terminal_content()),
-        ("files", files_content()),
-        ("snapshots", snapshots_content()),
-        ("settings", settings_content()),
-        dashboard_content()  # default
-    )
+# Each page is its own route, so Reflex compiles and loads them separately
+PAGES = (
+    ("dashboard", dashboard_content, "Grainchain Dashboard - Professional Sandbox Management"),
+    ("providers", providers_content, "Providers - Grainchain Dashboard"),
+    ("terminal", terminal_content, "Terminal - Grainchain Dashboard"),
+    ("files", files_content, "Files - Grainchain Dashboard"),
+    ("snapshots", snapshots_content, "Snapshots - Grainchain Dashboard"),
+    ("settings", settings_content, "Settings - Grainchain Dashboard"),
+)
 
-def index() -> rx.Component:
+# Data loaders that only run when their page is opened
+PAGE_LOADERS = {
+    "providers": [DashboardState.load_providers_from_db],
+}
+
+def layout(content: rx.Component) -> rx.Component:
     """Main page layout."""
     return rx.hstack(
         sidebar(),
         rx.box(
-            page_content(),
+            content,
             style={"flex": "1", "background": "var(--gray-1)", "overflow": "auto"}
         ),
         spacing="0",
@@ -53,7 +51,14 @@ app = rx.App(
     style={"font_family": "Inter, system-ui, sans-serif"}
 )
 
-app.add_page(index, route="/", title="Grainchain Dashboard - Professional Sandbox Management")
+for page, content, title in PAGES:
+    app.add_page(
+        layout(content()),
+        route=PAGE_ROUTES[page],
+        title=title,
+        on_load=[DashboardState.enter_page(page), *PAGE_LOADERS.get(page, [])]
+    )
+app.register_lifespan_task(flush_activity_log)
 
 if __name__ == "__main__":
     print("🚀 Starting Grainchain Dashboard...")
@@ -1,19 +1,152 @@
 """Consolidated Dashboard State Management."""
 
+import asyncio
+import json
 import reflex as rx
-from typing import Dict, List, Optional, Any
-import sys
-import os
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ..database import get_provider_configs, log_activities, save_provider_config as db_save_provider_config
 
-try:
-    from database import get_db_session, log_activity, get_setting, set_setting
-    from models import ProviderConfig, FileMetadata, Snapshot, CommandHistory, UserSettings
-    from utils.encryption import encrypt_api_key, decrypt_api_key, secure_api_key_display, validate_api_key_format, sanitize_input
-except ImportError as e:
-    print(f"⚠️ Import warning: {e}")
+# Activity log entries are queued by event handlers and written in batches
+ACTIVITY_BATCH_SIZE = 100
+ACTIVITY_FLUSH_INTERVAL = 0.5  # seconds
+ACTIVITY_QUEUE_LIMIT = 10_000
+
+_activity_queue: asyncio.Queue = asyncio.Queue(maxsize=ACTIVITY_QUEUE_LIMIT)
+
+DEFAULT_COMMAND_HISTORY_LIMIT = 100
+
+# Route of each dashboard page
+PAGE_ROUTES: Dict[str, str] = {
+    "dashboard": "/",
+    "providers": "/providers",
+    "terminal": "/terminal",
+    "files": "/files",
+    "snapshots": "/snapshots",
+    "settings": "/settings",
+}
+
+# Lines of terminal scrollback, kept server-side for (re)mounting the
+# terminal and in the browser, where the terminal's script appends live output
+TERMINAL_WINDOW_LINES = 5000
+
+# Characters of output kept per command; the line window alone does not
+# bound a single very long line
+MAX_STORED_OUTPUT = 65536
+
+WELCOME_OUTPUT = "$ _"
+
+# Display format of snapshot timestamps, applied once when the record is made
+SNAPSHOT_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Rows of the files table rendered at once
+FILES_PAGE_SIZE = 50
+
+# Delay before a keystroke in the terminal input is sent to the server
+COMMAND_INPUT_DEBOUNCE_MS = 150
+
+# Simulated terminal commands: exact matches first, then prefix handlers
+_COMMANDS: Dict[str, Callable[[str], str]] = {
+    "ls": lambda command: "main.py  README.md  src  tests  requirements.txt",
+}
+_PREFIX_COMMANDS: Tuple[Tuple[str, Callable[[str], str]], ...] = (
+    ("echo", lambda command: command[5:]),
+)
+
+# Card icon per provider; anything not listed is a cloud provider
+_PROVIDER_ICONS: Dict[str, str] = {"local": "🏠"}
+_CLOUD_PROVIDER_ICON = "☁️"
+
+def _api_key_label(has_api_key: bool) -> str:
+    """Display label for a provider's API key status."""
+    return "API Key: ✅ Configured" if has_api_key else "API Key: ❌ Missing"
+
+def _provider_entry(provider: str, name: str, status: str, has_api_key: bool, description: str) -> Dict[str, Any]:
+    """Build a provider record with its display fields filled in."""
+    return {
+        "name": name,
+        "icon": _PROVIDER_ICONS.get(provider, _CLOUD_PROVIDER_ICON),
+        "status": status,
+        "has_api_key": has_api_key,
+        "api_key_label": _api_key_label(has_api_key),
+        "description": description,
+    }
+
+def run_simulated_command(command: str) -> str:
+    """Return the simulated terminal output for a command."""
+    handler = _COMMANDS.get(command)
+    if handler is None:
+        for prefix, prefix_handler in _PREFIX_COMMANDS:
+            if command.startswith(prefix):
+                handler = prefix_handler
+                break
+        else:
+            return f"Command executed: {command}"
+    return handler(command)
+
+def _tail(text: str, limit: int) -> str:
+    """Keep only the last ``limit`` characters of a command's output."""
+    if len(text) <= limit:
+        return text
+    return f"... [{len(text) - limit} characters truncated]\n" + text[-limit:]
+
+def trim_terminal_output(text: str, max_lines: int) -> str:
+    """Keep only the last ``max_lines`` lines of terminal output."""
+    # rsplit only scans the tail, not the whole scrollback
+    lines = text.rsplit("\n", max_lines)
+    if len(lines) <= max_lines:
+        return text
+    return "\n".join(lines[1:])
+
+def log_user_activity(action: str, resource_type: str, resource_id: Optional[str] = None, details: Optional[dict] = None):
+    """Queue user activity for the background activity log writer."""
+    try:
+        _activity_queue.put_nowait({
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "details": details,
+        })
+    except asyncio.QueueFull:
+        # The activity log is best effort; drop entries rather than grow
+        # without bound while the writer is not running
+        pass
+
+def _take_queued_activities(entries: List[Dict[str, Any]]):
+    """Move every queued activity entry into ``entries``."""
+    while True:
+        try:
+            entries.append(_activity_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+
+async def flush_activity_log():
+    """Drain queued user activity into the database in batches.
+
+    A batch is written ACTIVITY_FLUSH_INTERVAL after its first entry arrives,
+    or as soon as it holds ACTIVITY_BATCH_SIZE entries, whichever comes first.
+    """
+    loop = asyncio.get_running_loop()
+    entries: List[Dict[str, Any]] = []
+    try:
+        while True:
+            entries.append(await _activity_queue.get())
+            try:
+                async with asyncio.timeout_at(loop.time() + ACTIVITY_FLUSH_INTERVAL):
+                    while len(entries) < ACTIVITY_BATCH_SIZE:
+                        entries.append(await _activity_queue.get())
+            except TimeoutError:
+                pass
+            batch, entries = entries, []
+            await asyncio.to_thread(log_activities, batch)
+    finally:
+        # On shutdown, write what is still pending rather than dropping it;
+        # a batch already handed to the writer thread is not repeated
+        _take_queued_activities(entries)
+        if entries:
+            log_activities(entries)
 
 class DashboardState(rx.State):
     """Consolidated dashboard state with all features."""
@@ -22,64 +155,31 @@ class DashboardState(rx.State):
     current_page: str = "dashboard"
     
     # Statistics
-    active_sandboxes_count: int = 1
-    providers_count: int = 5
-    commands_run_count: int = 42
+    _commands_run: int = 0
     
-    # Provider management
+    # Provider management; icon and api_key_label are display strings kept
+    # alongside the data so the provider cards render them directly
     providers: Dict[str, Dict[str, Any]] = {
-        "local": {"name": "Local", "status": "success", "has_api_key": True, "description": "Local development environment"},
-        "e2b": {"name": "E2B", "status": "failed", "has_api_key": False, "description": "Cloud sandboxes with templates"},
-        "daytona": {"name": "Daytona", "status": "unknown", "has_api_key": False, "description": "Development workspaces"},
-        "morph": {"name": "Morph", "status": "unknown", "has_api_key": False, "description": "Custom VMs with fast snapshots"},
-        "modal": {"name": "Modal", "status": "unknown", "has_api_key": False, "description": "Serverless compute platform"},
+        "local": _provider_entry("local", "Local", "success", True, "Local development environment"),
+        "e2b": _provider_entry("e2b", "E2B", "failed", False, "Cloud sandboxes with templates"),
+        "daytona": _provider_entry("daytona", "Daytona", "unknown", False, "Development workspaces"),
+        "morph": _provider_entry("morph", "Morph", "unknown", False, "Custom VMs with fast snapshots"),
+        "modal": _provider_entry("modal", "Modal", "unknown", False, "Serverless compute platform"),
     }
     
-    # File management
+    # File management; the full listing stays server-side and only the
+    # current window of rows is sent to the client
     current_directory: str = "/"
-    files: List[Dict[str, Any]] = [
-        {"name": "main.py", "size": 1024, "type": "file", "modified": "2025-01-05 10:30", "path": "/main.py"},
-        {"name": "README.md", "size": 2048, "type": "file", "modified": "2025-01-05 10:25", "path": "/README.md"},
-        {"name": "src", "size": 0, "type": "directory", "modified": "2025-01-05 10:20", "path": "/src"},
-        {"name": "tests", "size": 0, "type": "directory", "modified": "2025-01-05 10:15", "path": "/tests"},
-        {"name": "requirements.txt", "size": 512, "type": "file", "modified": "2025-01-05 10:10", "path": "/requirements.txt"},
-    ]
+    _files: List[Dict[str, Any]] = []
+    files_offset: int = 0
     
     # Snapshot management
-    snapshots: List[Dict[str, Any]] = [
-        {"id": "snap_001", "name": "Initial Setup", "status": "ready", "size": "50MB", "created": "2025-01-05 09:00", "files_count": 15},
-        {"id": "snap_002", "name": "After Dependencies", "status": "ready", "size": "120MB", "created": "2025-01-05 09:30", "files_count": 45},
-        {"id": "snap_003", "name": "Working Implementation", "status": "creating", "size": "200MB", "created": "2025-01-05 10:00", "files_count": 78},
-    ]
+    snapshots: List[Dict[str, Any]] = []
     
     # Terminal
-    command_history: List[str] = ["ls -la", "python --version", "pip install -r requirements.txt", "python main.py"]
-    command_output: str = """$ ls -la
-total 24
-drwxr-xr-x 5 user user 4096 Jan  5 10:30 .
-drwxr-xr-x 3 root root 4096 Jan  5 10:00 ..
--rw-r--r-- 1 user user 1024 Jan  5 10:30 main.py
--rw-r--r-- 1 user user 2048 Jan  5 10:25 README.md
--rw-r--r-- 1 user user  512 Jan  5 10:10 requirements.txt
-drwxr-xr-x 2 user user 4096 Jan  5 10:20 src
-drwxr-xr-x 2 user user 4096 Jan  5 10:15 tests
-
-$ python --version
-Python 3.12.0
-
-$ pip install -r requirements.txt
-Collecting reflex>=0.8.0
-  Downloading reflex-0.8.5-py3-none-any.whl
-Installing collected packages: reflex, sqlalchemy, cryptography
-Successfully installed reflex-0.8.5 sqlalchemy-2.0.42 cryptography-45.0.5
-
-$ python main.py
-🚀 Grainchain Dashboard starting...
-✅ Database initialized
-✅ All components loaded
-🌐 Server running on http://localhost:3000
-
-$ _"""
+    _command_history: deque = deque(maxlen=DEFAULT_COMMAND_HISTORY_LIMIT)
+    command_output: str = WELCOME_OUTPUT
+    _terminal_output: str = WELCOME_OUTPUT
     current_command: str = ""
     
     # Settings
@@ -87,7 +187,7 @@ $ _"""
     default_provider: str = "local"
     notifications_enabled: bool = True
     auto_save_enabled: bool = True
-    command_history_limit: int = 100
+    command_history_limit: int = DEFAULT_COMMAND_HISTORY_LIMIT
     
     # UI State
     show_provider_modal: bool = False
@@ -100,9 +200,83 @@ $ _"""
     snapshot_name: str = ""
     snapshot_description: str = ""
     
+    @rx.var(cache=True)
+    def configured_providers_count(self) -> int:
+        """Number of providers whose configuration checks out."""
+        return sum(1 for provider in self.providers.values() if provider["status"] == "success")
+    
+    @rx.var(cache=True)
+    def providers_count(self) -> int:
+        """Number of known providers."""
+        return len(self.providers)
+    
+    @rx.var(cache=True)
+    def commands_run_count(self) -> int:
+        """Number of commands executed this session."""
+        return self._commands_run
+    
+    @rx.var(cache=True)
+    def visible_files(self) -> List[Dict[str, Any]]:
+        """The window of file rows currently rendered, with display fields."""
+        return [
+            {
+                **file,
+                "is_directory": file["type"] == "directory",
+                "size_label": f"{file['size']} bytes" if file["type"] == "file" else "-",
+            }
+            for file in self._files[self.files_offset:self.files_offset + FILES_PAGE_SIZE]
+        ]
+    
+    @rx.var(cache=True)
+    def has_previous_files(self) -> bool:
+        """Whether there are file rows before the rendered window."""
+        return self.files_offset > 0
+    
+    @rx.var(cache=True)
+    def has_next_files(self) -> bool:
+        """Whether there are file rows after the rendered window."""
+        return self.files_offset + FILES_PAGE_SIZE < len(self._files)
+    
+    @rx.var(cache=True)
+    def files_page(self) -> int:
+        """One-based number of the rendered files page."""
+        return self.files_offset // FILES_PAGE_SIZE + 1
+    
+    @rx.var(cache=True)
+    def files_page_count(self) -> int:
+        """Number of files pages, at least one."""
+        return max(1, (len(self._files) + FILES_PAGE_SIZE - 1) // FILES_PAGE_SIZE)
+    
+    @rx.var(cache=True)
+    def command_history(self) -> List[str]:
+        """Command history, oldest first, bounded by command_history_limit."""
+        return list(self._command_history)
+    
+    def _record_command(self, command: str):
+        """Append a command to the bounded history."""
+        self._command_history.append(command)
+        self._commands_run += 1
+        # deque mutations are not tracked by Reflex, so reassign to mark dirty
+        self._command_history = self._command_history
+    
+    def set_command_history_limit(self, limit: int):
+        """Set the history limit, dropping the oldest commands beyond it."""
+        self.command_history_limit = limit
+        self._command_history = deque(self._command_history, maxlen=limit)
+    
     def set_page(self, page: str):
         """Navigate to a different page."""
+        return rx.redirect(PAGE_ROUTES[page])
+    
+    def enter_page(self, page: str):
+        """Record the page being shown; runs as each route's on_load."""
         self.current_page = page
+        if page == "terminal":
+            self.sync_terminal_output()
+    
+    def sync_terminal_output(self):
+        """Refresh the mounted terminal text from the rolling output window."""
+        self.command_output = self._terminal_output
     
     def open_provider_modal(self, provider: str):
         """Open provider configuration modal."""
@@ -119,7 +293,9 @@ $ _"""
         if self.provider_api_key.strip():
             if self.selected_provider in self.providers:
                 self.providers[self.selected_provider]["has_api_key"] = True
+                self.providers[self.selected_provider]["api_key_label"] = _api_key_label(True)
                 self.providers[self.selected_provider]["status"] = "success"
+                log_user_activity("configure", "provider", self.selected_provider)
         self.close_provider_modal()
     
     def open_file_upload_modal(self):
@@ -148,56 +324,72 @@ $ _"""
                 "name": self.snapshot_name,
                 "status": "creating",
                 "size": "0MB",
-                "created": "2025-01-05 10:35",
-                "files_count": len(self.files)
+                "created": datetime.now().strftime(SNAPSHOT_TIME_FORMAT),
+                "files_count": len(self._files)
             }
             self.snapshots.append(new_snapshot)
+            log_user_activity("create", "snapshot", new_snapshot["id"])
         self.close_snapshot_modal()
     
     def delete_snapshot(self, snapshot_id: str):
         """Delete a snapshot."""
         self.snapshots = [s for s in self.snapshots if s["id"] != snapshot_id]
+        log_user_activity("delete", "snapshot", snapshot_id)
+    
+    def set_current_command(self, command: str):
+        """Update the pending terminal command."""
+        self.current_command = command
     
     def execute_command(self):
-        """Execute terminal command."""
+        """Execute terminal command, sending only the new output to the client."""
         if self.current_command.strip():
-            self.command_history.append(self.current_command)
-            self.command_output += f"\n\n$ {self.current_command}\n"
-            if self.current_command == "ls":
-                self.command_output += "main.py  README.md  src  tests  requirements.txt"
-            elif self.current_command.startswith("echo"):
-                self.command_output += self.current_command[5:]
-            else:
-                self.command_output += f"Command executed: {self.current_command}"
-            self.command_output += "\n\n$ _"
+            self._record_command(self.current_command)
+            log_user_activity("execute", "command", details={"command": self.current_command})
+            delta = f"\n\n$ {self.current_command}\n{_tail(run_simulated_command(self.current_command), MAX_STORED_OUTPUT)}\n\n$ _"
+            self._terminal_output = trim_terminal_output(
+                self._terminal_output + delta, TERMINAL_WINDOW_LINES
+            )
             self.current_command = ""
+            return rx.call_script(f"window.__appendTerminal({json.dumps(delta)})")
+    
+    def next_files_page(self):
+        """Move the files table window forward."""
+        if self.files_offset + FILES_PAGE_SIZE < len(self._files):
+            self.files_offset += FILES_PAGE_SIZE
+    
+    def previous_files_page(self):
+        """Move the files table window back."""
+        self.files_offset = max(0, self.files_offset - FILES_PAGE_SIZE)
     
     def delete_file(self, file_path: str):
         """Delete a file."""
-        self.files = [f for f in self.files if f["path"] != file_path]
+        self._files = [f for f in self._files if f["path"] != file_path]
+        log_user_activity("delete", "file", file_path)
+        if self.files_offset >= len(self._files):
+            self.previous_files_page()
     
     # Database integration methods
     async def load_providers_from_db(self):
         """Load provider configurations from database."""
         try:
-            session = get_db_session()
-            # Implementation would load from database
-            pass
+            for stored in await asyncio.to_thread(get_provider_configs):
+                provider = self.providers.get(stored["provider_name"])
+                if provider is None:
+                    continue
+                # Rows are seeded without keys or test results, so only take
+                # what the database actually records; a missing key must not
+                # mark a provider that needs none (local) as unconfigured
+                if stored["tested"]:
+                    provider["status"] = stored["test_status"]
+                if stored["has_api_key"]:
+                    provider["has_api_key"] = True
+                    provider["api_key_label"] = _api_key_label(True)
         except Exception as e:
             print(f"Error loading providers: {e}")
     
     async def save_provider_to_db(self, provider_name: str, config: dict):
         """Save provider configuration to database."""
         try:
-            session = get_db_session()
-            # Implementation would save to database
-            pass
+            await asyncio.to_thread(db_save_provider_config, provider_name, config)
         except Exception as e:
             print(f"Error saving provider: {e}")
-    
-    async def log_user_activity(self, action: str, details: str = ""):
-        """Log user activity to database."""
-        try:
-            log_activity("dashboard", action, details)
-        except Exception as e:
-            print(f"Error logging activity: {e}")
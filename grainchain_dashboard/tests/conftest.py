@@ -0,0 +1,35 @@
+"""Shared pytest configuration for the dashboard tests."""
+
+import os
+from collections import deque
+
+import pytest
+
+from grainchain_dashboard.tests.fixtures import (
+    SAMPLE_COMMAND_HISTORY,
+    SAMPLE_FILES,
+    SAMPLE_SNAPSHOTS,
+    SAMPLE_TERMINAL_OUTPUT,
+)
+
+# database.py builds its engine at import time, so this has to be set before
+# any test module imports the dashboard; keep that database in memory instead
+# of creating a file in the cwd
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+
+@pytest.fixture
+def seeded_dashboard():
+    """A dashboard state populated with the sample sandbox contents."""
+    # Imported here so DATABASE_URL above is set before the dashboard loads
+    from grainchain_dashboard.src.state import DashboardState
+
+    dashboard = DashboardState(_reflex_internal_init=True)
+    dashboard._files = [dict(file) for file in SAMPLE_FILES]
+    dashboard.snapshots = [dict(snapshot) for snapshot in SAMPLE_SNAPSHOTS]
+    dashboard._command_history = deque(
+        SAMPLE_COMMAND_HISTORY, maxlen=dashboard.command_history_limit
+    )
+    dashboard._terminal_output = SAMPLE_TERMINAL_OUTPUT
+    dashboard.command_output = SAMPLE_TERMINAL_OUTPUT
+    return dashboard
@@ -1 +1,55 @@
-"""Test fixtures for Grainchain Dashboard."""
+"""Test fixtures for Grainchain Dashboard.
+
+Sample sandbox contents for tests that need a populated dashboard; the
+dashboard state itself starts empty.
+"""
+
+from typing import Any, Dict, List
+
+SAMPLE_FILES: List[Dict[str, Any]] = [
+    {"name": "main.py", "size": 1024, "type": "file", "modified": "2025-01-05 10:30", "path": "/main.py"},
+    {"name": "README.md", "size": 2048, "type": "file", "modified": "2025-01-05 10:25", "path": "/README.md"},
+    {"name": "src", "size": 0, "type": "directory", "modified": "2025-01-05 10:20", "path": "/src"},
+    {"name": "tests", "size": 0, "type": "directory", "modified": "2025-01-05 10:15", "path": "/tests"},
+    {"name": "requirements.txt", "size": 512, "type": "file", "modified": "2025-01-05 10:10", "path": "/requirements.txt"},
+]
+
+SAMPLE_SNAPSHOTS: List[Dict[str, Any]] = [
+    {"id": "snap_001", "name": "Initial Setup", "status": "ready", "size": "50MB", "created": "2025-01-05 09:00", "files_count": 15},
+    {"id": "snap_002", "name": "After Dependencies", "status": "ready", "size": "120MB", "created": "2025-01-05 09:30", "files_count": 45},
+    {"id": "snap_003", "name": "Working Implementation", "status": "creating", "size": "200MB", "created": "2025-01-05 10:00", "files_count": 78},
+]
+
+SAMPLE_COMMAND_HISTORY: List[str] = [
+    "ls -la",
+    "python --version",
+    "pip install -r requirements.txt",
+    "python main.py",
+]
+
+SAMPLE_TERMINAL_OUTPUT = """$ ls -la
+total 24
+drwxr-xr-x 5 user user 4096 Jan  5 10:30 .
+drwxr-xr-x 3 root root 4096 Jan  5 10:00 ..
+-rw-r--r-- 1 user user 1024 Jan  5 10:30 main.py
+-rw-r--r-- 1 user user 2048 Jan  5 10:25 README.md
+-rw-r--r-- 1 user user  512 Jan  5 10:10 requirements.txt
+drwxr-xr-x 2 user user 4096 Jan  5 10:20 src
+drwxr-xr-x 2 user user 4096 Jan  5 10:15 tests
+
+$ python --version
+Python 3.12.0
+
+$ pip install -r requirements.txt
+Collecting reflex>=0.8.0
+  Downloading reflex-0.8.5-py3-none-any.whl
+Installing collected packages: reflex, sqlalchemy, cryptography
+Successfully installed reflex-0.8.5 sqlalchemy-2.0.42 cryptography-45.0.5
+
+$ python main.py
+🚀 Grainchain Dashboard starting...
+✅ Database initialized
+✅ All components loaded
+🌐 Server running on http://localhost:3000
+
+$ _"""
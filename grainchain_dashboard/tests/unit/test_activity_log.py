@@ -0,0 +1,94 @@
+"""Tests for the batched dashboard activity log."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from grainchain_dashboard.src import state
+from grainchain_dashboard.src.state import (
+    DashboardState,
+    flush_activity_log,
+    log_user_activity,
+)
+
+
+@pytest.fixture
+def written():
+    """Give each test an empty queue and collect the batches written."""
+    batches = []
+    with (
+        patch.object(
+            state, "_activity_queue", asyncio.Queue(maxsize=state.ACTIVITY_QUEUE_LIMIT)
+        ),
+        patch.object(
+            state, "log_activities", lambda entries: batches.append(list(entries))
+        ),
+    ):
+        yield batches
+
+
+async def stop(task: asyncio.Task):
+    """Cancel the flush task the way app shutdown does."""
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_handlers_queue_activity(written):
+    """Deleting a snapshot records it without touching the database."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+
+    DashboardState.delete_snapshot.fn(dashboard, "snap_001")
+
+    assert state._activity_queue.get_nowait()["resource_id"] == "snap_001"
+    assert written == []
+
+
+async def test_entries_are_written_together_after_the_interval(written):
+    """Entries arriving within the interval share one batch."""
+    with patch.object(state, "ACTIVITY_FLUSH_INTERVAL", 0.05):
+        task = asyncio.create_task(flush_activity_log())
+        for index in range(3):
+            log_user_activity("delete", "file", f"/tmp/{index}")
+        await asyncio.sleep(0.2)
+        await stop(task)
+
+    assert [len(batch) for batch in written] == [3]
+
+
+async def test_full_batch_is_written_without_waiting(written):
+    """Reaching the batch size flushes before the interval runs out."""
+    with patch.object(state, "ACTIVITY_FLUSH_INTERVAL", 60):
+        task = asyncio.create_task(flush_activity_log())
+        for index in range(state.ACTIVITY_BATCH_SIZE + 1):
+            log_user_activity("delete", "file", f"/tmp/{index}")
+        await asyncio.sleep(0.1)
+        assert [len(batch) for batch in written] == [state.ACTIVITY_BATCH_SIZE]
+        await stop(task)
+
+    # The entry left over from the full batch is written on shutdown
+    assert [len(batch) for batch in written] == [state.ACTIVITY_BATCH_SIZE, 1]
+
+
+async def test_pending_entries_are_written_on_shutdown(written):
+    """Stopping the task writes entries still waiting for the interval."""
+    with patch.object(state, "ACTIVITY_FLUSH_INTERVAL", 60):
+        task = asyncio.create_task(flush_activity_log())
+        log_user_activity("create", "snapshot", "snap_001")
+        log_user_activity("delete", "snapshot", "snap_001")
+        await asyncio.sleep(0)
+        await stop(task)
+
+    assert [[entry["action"] for entry in batch] for batch in written] == [
+        ["create", "delete"]
+    ]
+
+
+def test_queue_is_bounded(written):
+    """Activity beyond the queue limit is dropped instead of piling up."""
+    with patch.object(state, "_activity_queue", asyncio.Queue(maxsize=2)):
+        for index in range(3):
+            log_user_activity("delete", "file", f"/tmp/{index}")
+
+        assert state._activity_queue.qsize() == 2
@@ -0,0 +1,73 @@
+"""Tests for the windowed dashboard file list."""
+
+from grainchain_dashboard.src.state import FILES_PAGE_SIZE, DashboardState
+
+
+def make_dashboard(count: int) -> DashboardState:
+    """Build a dashboard listing ``count`` files."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+    dashboard._files = [
+        {
+            "name": f"file{index}",
+            "size": 1,
+            "type": "file",
+            "modified": "",
+            "path": f"/file{index}",
+        }
+        for index in range(count)
+    ]
+    return dashboard
+
+
+def test_full_listing_is_not_sent_to_the_client():
+    """Only the window and page counts are frontend vars."""
+    dashboard = make_dashboard(FILES_PAGE_SIZE * 2)
+
+    (fields,) = dashboard.dict().values()
+
+    assert not any(name.startswith("_files") for name in fields)
+    assert len(dashboard.visible_files) == FILES_PAGE_SIZE
+
+
+def test_pages_move_the_window():
+    """Paging forward shows the next rows and stops at the last page."""
+    dashboard = make_dashboard(FILES_PAGE_SIZE + 1)
+    assert (dashboard.files_page, dashboard.files_page_count) == (1, 2)
+
+    DashboardState.next_files_page.fn(dashboard)
+    DashboardState.next_files_page.fn(dashboard)
+
+    assert dashboard.files_page == 2
+    assert [file["name"] for file in dashboard.visible_files] == [
+        f"file{FILES_PAGE_SIZE}"
+    ]
+    assert not dashboard.has_next_files
+
+
+def test_deleting_the_last_row_of_a_page_moves_back():
+    """Removing the only row on the last page shows the previous page."""
+    dashboard = make_dashboard(FILES_PAGE_SIZE + 1)
+    DashboardState.next_files_page.fn(dashboard)
+
+    DashboardState.delete_file.fn(dashboard, f"/file{FILES_PAGE_SIZE}")
+
+    assert (dashboard.files_page, dashboard.files_page_count) == (1, 1)
+    assert len(dashboard.visible_files) == FILES_PAGE_SIZE
+
+
+def test_rows_carry_display_fields(seeded_dashboard):
+    """Directories get no size label and files get their byte count."""
+    rows = {file["name"]: file for file in seeded_dashboard.visible_files}
+
+    assert rows["src"]["is_directory"] is True
+    assert rows["src"]["size_label"] == "-"
+    assert rows["main.py"]["size_label"] == "1024 bytes"
+
+
+def test_dashboard_starts_empty():
+    """Without sample data there is nothing to list."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+
+    assert dashboard.visible_files == []
+    assert dashboard.snapshots == []
+    assert dashboard.command_history == []
@@ -0,0 +1,56 @@
+"""Tests for loading provider settings from the dashboard database."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+
+from grainchain_dashboard import database
+from grainchain_dashboard.models import ProviderConfig
+from grainchain_dashboard.src.state import DashboardState
+
+
+@pytest.fixture
+def seeded_db(tmp_path):
+    """Point the dashboard at a fresh file database seeded with defaults."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'dashboard.db'}")
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with (
+        patch.object(database, "engine", engine),
+        patch.object(database, "SessionLocal", session_factory),
+    ):
+        database.init_database()
+        yield
+    engine.dispose()
+
+
+async def test_seeded_rows_keep_provider_defaults(seeded_db):
+    """Untested rows without keys leave the built-in provider state alone."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+
+    await DashboardState.load_providers_from_db.fn(dashboard)
+
+    local = dashboard.providers["local"]
+    assert local["status"] == "success"
+    assert local["has_api_key"] is True
+    assert local["api_key_label"] == "API Key: ✅ Configured"
+    assert dashboard.providers["e2b"]["status"] == "failed"
+
+
+async def test_stored_key_and_test_result_are_applied(seeded_db):
+    """A saved key and a recorded test result override the defaults."""
+    with database.session_scope() as db:
+        row = db.query(ProviderConfig).filter_by(provider_name="daytona").one()
+        row.api_key = "secret"
+        row.test_status = "success"
+        row.last_tested = datetime.now()
+    dashboard = DashboardState(_reflex_internal_init=True)
+
+    await DashboardState.load_providers_from_db.fn(dashboard)
+
+    daytona = dashboard.providers["daytona"]
+    assert daytona["status"] == "success"
+    assert daytona["has_api_key"] is True
+    assert daytona["api_key_label"] == "API Key: ✅ Configured"
@@ -0,0 +1,28 @@
+"""Tests for dashboard snapshot records."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from grainchain_dashboard.src import state
+from grainchain_dashboard.src.state import DashboardState
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is fixed."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 1, 5, 10, 35, 12)
+
+
+def test_created_time_is_formatted_when_the_snapshot_is_made():
+    """The record keeps the creation time as a display string."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+    dashboard.snapshot_name = "Before upgrade"
+
+    with patch.object(state, "datetime", FrozenDatetime):
+        DashboardState.create_snapshot.fn(dashboard)
+
+    (snapshot,) = dashboard.snapshots
+    assert snapshot["created"] == "2025-01-05 10:35"
+    assert snapshot["id"] == "snap_001"
@@ -0,0 +1,74 @@
+"""Tests for the dashboard terminal scrollback."""
+
+from unittest.mock import patch
+
+from grainchain_dashboard.src import state
+from grainchain_dashboard.src.state import DashboardState, trim_terminal_output
+
+
+def run_command(dashboard: DashboardState, command: str):
+    """Submit a command through the terminal input."""
+    dashboard.current_command = command
+    DashboardState.execute_command.fn(dashboard)
+
+
+def test_trim_keeps_short_output():
+    """Output within the limit is returned unchanged."""
+    assert trim_terminal_output("a\nb", 2) == "a\nb"
+
+
+def test_trim_drops_oldest_lines():
+    """Only the newest lines are kept once the limit is exceeded."""
+    assert trim_terminal_output("a\nb\nc\nd", 2) == "c\nd"
+
+
+def test_full_window_drops_only_the_oldest_lines():
+    """A full scrollback keeps all but the lines pushed out by new output."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+    window = state.TERMINAL_WINDOW_LINES
+    dashboard._terminal_output = "\n".join(f"line {i}" for i in range(window))
+
+    run_command(dashboard, "echo next")
+
+    lines = dashboard._terminal_output.split("\n")
+    added = 5  # blank, prompt, output, blank, cursor
+    assert len(lines) == window
+    assert lines[0] == f"line {added}"
+    assert lines[-4:] == ["$ echo next", "next", "", "$ _"]
+
+
+def test_appending_past_limit_trims_oldest_lines():
+    """Running commands past the window drops the earliest output first."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+
+    with patch.object(state, "TERMINAL_WINDOW_LINES", 6):
+        run_command(dashboard, "echo first")
+        run_command(dashboard, "echo second")
+        run_command(dashboard, "echo third")
+
+    lines = dashboard._terminal_output.split("\n")
+    assert len(lines) == 6
+    assert "first" not in dashboard._terminal_output
+    assert lines[-3:] == ["third", "", "$ _"]
+
+
+def test_long_output_is_capped_per_command():
+    """Only the tail of a very long output line is kept, with a marker."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+
+    with patch.object(state, "MAX_STORED_OUTPUT", 10):
+        run_command(dashboard, "echo " + "x" * 20 + "0123456789")
+
+    assert "... [20 characters truncated]\n0123456789" in dashboard._terminal_output
+
+
+def test_history_keeps_only_the_newest_commands():
+    """The command history evicts the oldest entries past its limit."""
+    dashboard = DashboardState(_reflex_internal_init=True)
+    DashboardState.set_command_history_limit.fn(dashboard, 3)
+
+    for index in range(5):
+        run_command(dashboard, f"echo {index}")
+
+    assert dashboard.command_history == ["echo 2", "echo 3", "echo 4"]
+    assert dashboard.commands_run_count == 5
@@ -2,6 +2,7 @@
 Tests specifically for comparison functionality
 """
 
+import dataclasses
 from datetime import datetime, timedelta
 from unittest.mock import Mock
 
@@ -462,7 +463,9 @@ class TestProviderRecommendation:
         ]
         assert 0 <= recommendation.confidence_score <= 1
         assert len(recommendation.reasoning) > 0
-        assert "performance_summary" in recommendation.__dict__
+        assert "performance_summary" in {
+            field.name for field in dataclasses.fields(recommendation)
+        }
 
     def test_recommend_provider_reliability(self):
         """Test provider recommendation for reliability use case"""
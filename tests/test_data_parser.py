@@ -0,0 +1,50 @@
+"""
+Tests for loading benchmark result files
+"""
+
+import json
+from pathlib import Path
+
+from benchmarks.analysis.data_parser import BenchmarkDataParser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestResultCache:
+    """Test cases for reusing parsed result files between loads"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        with open(FIXTURES_DIR / "sample_benchmark_data.json") as f:
+            self.sample_data = json.load(f)
+
+    def write_result(self, results_dir, test_scenarios):
+        """Write a result file with the given scenario count"""
+        self.sample_data["benchmark_info"]["test_scenarios"] = test_scenarios
+        json_file = results_dir / "grainchain_benchmark_20250601_100000.json"
+        with open(json_file, "w") as f:
+            json.dump(self.sample_data, f)
+
+    def test_unchanged_files_are_not_parsed_again(self, tmp_path):
+        """Test that loading twice returns the cached result objects"""
+        self.write_result(tmp_path, 5)
+
+        parser = BenchmarkDataParser(tmp_path)
+        first = parser.load_all_results()
+        second = parser.load_all_results()
+
+        assert len(first) == 1
+        assert first[0] is second[0]
+
+    def test_rewritten_files_are_parsed_again(self, tmp_path):
+        """Test that rewriting a file invalidates its cached result"""
+        self.write_result(tmp_path, 5)
+        parser = BenchmarkDataParser(tmp_path)
+        first = parser.load_all_results()
+
+        # A different size changes the cache key even if the mtime does not
+        self.write_result(tmp_path, 12)
+        second = parser.load_all_results()
+
+        assert second[0] is not first[0]
+        assert second[0].test_scenarios == 12
@@ -0,0 +1,257 @@
+"""Tests for the local sandbox provider."""
+
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from grainchain.core.config import ProviderConfig
+from grainchain.core.interfaces import SandboxConfig, SandboxSession
+from grainchain.core.sandbox import Sandbox
+from grainchain.providers.local import LocalProvider, _split_simple_command
+
+
+def _is_running(pid: int) -> bool:
+    """Whether a process exists and has not exited (zombies count as exited)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+async def _wait_for_exit(pid: int, timeout: float = 5.0) -> bool:
+    """Wait for a process to exit; SIGKILL is delivered asynchronously."""
+    deadline = time.monotonic() + timeout
+    while _is_running(pid):
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Create a local sandbox session rooted in a temporary directory."""
+    provider = LocalProvider(
+        ProviderConfig(name="local", config={"base_dir": str(tmp_path)})
+    )
+    session = await provider.create_sandbox(SandboxConfig(timeout=10))
+    yield session
+    await session.close()
+
+
+class TestSplitSimpleCommand:
+    """Test deciding which commands can skip /bin/sh."""
+
+    def test_plain_command(self):
+        """Test that a plain command is split on blanks."""
+        assert _split_simple_command("ls  -la\t/tmp") == ["ls", "-la", "/tmp"]
+
+    def test_only_blanks_separate_words(self):
+        """Test that NBSP and carriage returns stay inside words, as in sh."""
+        assert _split_simple_command("ls a\xa0b\r") == ["ls", "a\xa0b\r"]
+
+    @pytest.mark.parametrize(
+        "command", ["ls | wc -l", "echo $HOME", "cat 'a b'", "FOO=1 env", "ls *.py"]
+    )
+    def test_shell_syntax(self, command):
+        """Test that commands using shell syntax need the shell."""
+        assert _split_simple_command(command) is None
+
+    @pytest.mark.parametrize(
+        "command", [":", "cd /tmp", "echo hi", "true", "break", "let x", "if true"]
+    )
+    def test_builtins_and_reserved_words(self, command):
+        """Test that builtins and reserved words need the shell."""
+        assert _split_simple_command(command) is None
+
+    def test_blank_command(self):
+        """Test that an empty command needs the shell."""
+        assert _split_simple_command(" \t ") is None
+
+
+class TestLocalExecuteRouting:
+    """Test that commands are exec'd directly only when that matches sh."""
+
+    async def test_resolvable_command_is_execd(self, session):
+        """Test that a command found on PATH skips the shell."""
+        with (
+            patch.object(
+                asyncio, "create_subprocess_exec", wraps=asyncio.create_subprocess_exec
+            ) as exec_spy,
+            patch.object(
+                asyncio,
+                "create_subprocess_shell",
+                wraps=asyncio.create_subprocess_shell,
+            ) as shell_spy,
+        ):
+            result = await session.execute("ls -a")
+
+        assert result.success
+        assert exec_spy.call_args.args[:2] == ("ls", "-a")
+        shell_spy.assert_not_called()
+
+    async def test_builtin_runs_in_shell(self, session):
+        """Test that ':' keeps its shell meaning."""
+        result = await session.execute(":")
+
+        assert result.return_code == 0
+
+    async def test_unknown_command_runs_in_shell(self, session):
+        """Test that a missing command reports through the shell."""
+        with patch.object(
+            asyncio, "create_subprocess_exec", wraps=asyncio.create_subprocess_exec
+        ) as exec_spy:
+            result = await session.execute("grainchain-no-such-command --flag")
+
+        assert result.return_code == 127
+        assert "not found" in result.stderr
+        exec_spy.assert_not_called()
+
+    async def test_script_without_shebang_falls_back_to_shell(self, session):
+        """Test that ENOEXEC from exec retries the command through the shell."""
+        script = os.path.join(session.working_dir, "script")
+        with open(script, "w") as f:
+            f.write("printf ran\n")
+        os.chmod(script, 0o755)
+
+        with patch.object(
+            asyncio, "create_subprocess_exec", wraps=asyncio.create_subprocess_exec
+        ) as exec_spy:
+            result = await session.execute("./script")
+
+        exec_spy.assert_called_once()
+        assert result.return_code == 0
+        assert result.stdout == "ran"
+
+
+class TestLocalFailedResult:
+    """Test mapping spawn errors onto shell exit codes."""
+
+    def test_missing_program_maps_to_127(self, session):
+        """Test that a missing argv[0] returns the shell's 127."""
+        error = FileNotFoundError(2, "No such file or directory", "missing")
+        result = session._failed_result("missing --flag", error, 0.0)
+
+        assert result.return_code == 127
+        assert result.stderr == "missing: No such file or directory\n"
+
+    def test_non_executable_program_maps_to_126(self, session):
+        """Test that a non-executable argv[0] returns the shell's 126."""
+        error = PermissionError(13, "Permission denied", "tool")
+        result = session._failed_result("tool", error, 0.0)
+
+        assert result.return_code == 126
+
+    def test_unrelated_error_keeps_default_code(self, session):
+        """Test that errors about other paths are not mapped."""
+        error = FileNotFoundError(2, "No such file or directory", "/missing/cwd")
+        result = session._failed_result("ls", error, 0.0)
+
+        assert result.return_code == -1
+        assert not result.success
+
+
+class TestLocalExecuteStream:
+    """Test streaming command output from the local provider."""
+
+    async def test_output_arrives_in_chunks(self, session):
+        """Test that output is handed over before the command finishes."""
+        chunks = []
+
+        result = await session.execute_stream(
+            "printf one; sleep 0.2; printf two >&2; sleep 0.2; printf three",
+            on_output=lambda stream, text: chunks.append((stream, text)),
+        )
+
+        assert chunks == [("stdout", "one"), ("stderr", "two"), ("stdout", "three")]
+        assert result.stdout == "onethree"
+        assert result.stderr == "two"
+        assert result.success
+
+    async def test_multibyte_characters_split_across_reads(self, session):
+        """Test that UTF-8 sequences cut by the read size decode intact."""
+        with patch("grainchain.providers.local._STREAM_CHUNK_SIZE", 1):
+            result = await session.execute_stream(
+                "printf 'héllo'", on_output=lambda stream, text: None
+            )
+
+        assert result.stdout == "héllo"
+
+    async def test_timeout_kills_command(self, session):
+        """Test that a command running past the timeout is killed."""
+        chunks = []
+
+        result = await session.execute_stream(
+            "printf started; sleep 30",
+            on_output=lambda stream, text: chunks.append(text),
+            timeout=1,
+        )
+
+        assert chunks == ["started"]
+        assert not result.success
+        assert "timed out" in result.stderr
+        assert result.execution_time < 10
+
+    async def test_callback_failure_stops_command(self, session):
+        """Test that an exception from on_output kills everything the command started."""
+        pid_file = os.path.join(session.working_dir, "pid")
+
+        def on_output(stream, text):
+            raise RuntimeError("display failed")
+
+        result = await session.execute_stream(
+            "sleep 30 & echo $! > pid; printf x; wait", on_output=on_output
+        )
+
+        assert not result.success
+        assert "display failed" in result.stderr
+        assert result.execution_time < 10
+        with open(pid_file) as f:
+            pid = int(f.read())
+        assert await _wait_for_exit(pid)
+
+    async def test_sandbox_session_default_delivers_whole_streams(self, session):
+        """Test the fallback for providers that cannot stream output."""
+        chunks = []
+
+        result = await SandboxSession.execute_stream(
+            session,
+            "printf out; printf err >&2",
+            on_output=lambda stream, text: chunks.append((stream, text)),
+        )
+
+        assert chunks == [("stdout", "out"), ("stderr", "err")]
+        assert result.success
+
+    async def test_sandbox_session_default_reports_callback_failure(self, session):
+        """Test that the fallback turns an on_output error into a failed result."""
+
+        def on_output(stream, text):
+            raise RuntimeError("display failed")
+
+        result = await SandboxSession.execute_stream(
+            session, "printf out", on_output=on_output
+        )
+
+        assert not result.success
+        assert result.stderr == "display failed"
+
+    async def test_sandbox_streams_through_session(self, tmp_path):
+        """Test that Sandbox.execute_stream reaches the provider's streaming."""
+        provider = LocalProvider(
+            ProviderConfig(name="local", config={"base_dir": str(tmp_path)})
+        )
+        chunks = []
+
+        async with Sandbox(provider=provider, config=SandboxConfig()) as sandbox:
+            result = await sandbox.execute_stream(
+                "printf a; sleep 0.2; printf b",
+                on_output=lambda stream, text: chunks.append(text),
+            )
+
+        assert chunks == ["a", "b"]
+        assert result.stdout == "ab"
@@ -18,30 +18,19 @@ class TestProviderDiscovery:
         result = self.discovery.check_provider_dependencies("local")
         assert result is True
 
-    @patch("builtins.__import__")
-    def test_check_provider_dependencies_missing(self, mock_import):
+    @patch("grainchain.core.providers_info.importlib.util.find_spec")
+    def test_check_provider_dependencies_missing(self, mock_find_spec):
         """Test dependency check with missing package."""
-
-        def import_side_effect(name, *args, **kwargs):
-            if name == "e2b":
-                raise ImportError("No module named 'e2b'")
-            return __import__(name, *args, **kwargs)
-
-        mock_import.side_effect = import_side_effect
+        mock_find_spec.return_value = None
 
         result = self.discovery.check_provider_dependencies("e2b")
         assert result is False
+        mock_find_spec.assert_called_once_with("e2b")
 
-    @patch("builtins.__import__")
-    def test_check_provider_dependencies_available(self, mock_import):
+    @patch("grainchain.core.providers_info.importlib.util.find_spec")
+    def test_check_provider_dependencies_available(self, mock_find_spec):
         """Test dependency check with available package."""
-
-        def import_side_effect(name, *args, **kwargs):
-            if name == "e2b":
-                return Mock()
-            return __import__(name, *args, **kwargs)
-
-        mock_import.side_effect = import_side_effect
+        mock_find_spec.return_value = Mock()
 
         result = self.discovery.check_provider_dependencies("e2b")
         assert result is True